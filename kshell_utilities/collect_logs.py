@@ -2,17 +2,43 @@
 Author: Noritaka Shimizu (?)
 Modified by: Jon Dahl
 """
-import sys, os, warnings
-from typing import List, Tuple
+import sys, os, warnings, glob
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Iterator, List, Tuple, Union
 from fractions import Fraction
 from math import pi
+import numpy as np
+from .parameters import flags
+try:
+    from numba import njit
+except ModuleNotFoundError:
+    def njit(*args, **kwargs):
+        """
+        numba is optional. Without it, functions decorated with njit
+        run as regular numpy code.
+        """
+        return lambda func: func
 
 #weisskopf_threshold = 1.0 # threshold to show in W.u.
 weisskopf_threshold = -0.001
 
-n_jnp = {}
+E_data_fields = ("filename", "energy", "spin", "parity", "n_eig", "tt")   # Parallel lists of E_data.
+
+transit_log_dtype = [   # Columns of the new syntax transit log tables.
+    ("spin_final", int), ("idx_1", int), ("E_final", float),
+    ("spin_initial", int), ("idx_2", int), ("E_initial", float),
+    ("dE", float), ("Mred", float), ("B_decay", float), ("B_excite", float),
+    ("Mom", float)
+]
 
-E_gs = 0.0
+transit_log_columns_old = {   # Fixed column positions of the old syntax transit log tables.
+    "spin_final": (0, 2, int), "idx_1": (3, 7, int),
+    "E_final": (8, 17, float), "spin_initial": (17, 19, int),
+    "idx_2": (20, 24, int), "E_initial": (25, 34, float),
+    "dE": (34, 42, float), "B_decay": (52, 62, float),
+    "B_excite": (62, 72, float)
+}
 
 def parity_integer_to_string(i: int) -> str:
     """
@@ -31,6 +57,7 @@ def parity_integer_to_string(i: int) -> str:
     if i == 1: return '+'
     else: return '-'
 
+@lru_cache(maxsize=None)
 def weisskopf_unit(multipole_type: str, mass: int) -> Tuple[float, str]:
     """
     Generate the Weisskopf unit_weisskopf for input multipolarity and mass.
@@ -72,10 +99,11 @@ def weisskopf_unit(multipole_type: str, mass: int) -> Tuple[float, str]:
     
 def read_energy_logfile(filename: str, E_data: dict):
     """
-    Extract the energy, spin, and parity for each eigenstate and arrange
-    the data in a dictionary, E_data, where the keys are the energies
-    and the values are tuples of
-    (log filename, spin, parity, eigenstate number, tt).
+    Extract the energy, spin, and parity for each eigenstate and append
+    the data to E_data, a dictionary of parallel lists with the keys
+    in 'E_data_fields': log filename, energy, spin, parity, eigenstate
+    number, and tt. Element i of each list belongs to the same state,
+    and the states are stored in the order in which they were read.
 
     The transition logs will not be read by this function as they do not
     contain the energy level information. Only the KSHELL logs will be
@@ -85,42 +113,52 @@ def read_energy_logfile(filename: str, E_data: dict):
     ----------
     filename : str
         The log filename.
+
+    E_data : dict
+        {field: [], ...} for all fields in 'E_data_fields'. Is
+        modified in place.
     """
-    with open(filename, "r") as infile:
-        while True:
-            line = infile.readline()
-            if not line: break
-            if len(line) >= 11 and line[:11] != "H converged": continue
-            if len(line) >= 14 and line[:14] != "H bn converged": continue
-            while True:
-                line = infile.readline()
-                if not line: break
-                if line[6:10] == '<H>:':
-                    """
-                    Example:
-                    -------------------------------------------------
-                    1  <H>:  -391.71288  <JJ>:    -0.00000  J:  0/2  prty -1     <-- this line will be read
-                        <Hcm>:     0.00022  <TT>:     6.00000  T:  4/2              <-- this line will be read
-                    <p Nj>  5.944  3.678  1.489  3.267  0.123  0.456  0.043        <-- this line will be skipped
-                    <n Nj>  5.993  3.902  1.994  5.355  0.546  0.896  0.314        <-- this line will be skipped
-                    hw:  1:1.000                                                   <-- this line will be skipped
-                    -------------------------------------------------
-                    NOTE: All this substring indexing seems to be easily
-                    replaceable with a simple split!
-                    """
-                    n_eig = int(line[:5])       # Eigenvalue number. 1, 2, 3, ...
-                    energy = float(line[11:22])
-                    spin = int(line[45:48])     # 2*spin actually.
-                    parity = int(line[57:59])
-                    parity = parity_integer_to_string(parity)
-                    while energy in E_data: energy += 0.000001  # NOTE: To separate energies close together? Else keys may be identical!
-                    while True:
-                        line = infile.readline()
-                        if line[42:45] != ' T:': continue
-                        tt = int(line[45:48])
-                        E_data[ energy ] = (filename, spin, parity, n_eig, tt)
-                        break
+    with open(filename, "rb") as infile:
+        """
+        Read and decode the entire log at once, and walk through the
+        lines with a shared iterator. The loops below continue where the
+        previous one stopped.
+        """
+        lines = iter(infile.read().decode("ascii", "replace").split("\n"))
 
+    for line in lines:
+        if not line.startswith(("H converged", "H bn converged")): continue
+        for line in lines:
+            if '<H>:' in line:
+                """
+                Example:
+                -------------------------------------------------
+                1  <H>:  -391.71288  <JJ>:    -0.00000  J:  0/2  prty -1     <-- this line will be read
+                    <Hcm>:     0.00022  <TT>:     6.00000  T:  4/2              <-- this line will be read
+                <p Nj>  5.944  3.678  1.489  3.267  0.123  0.456  0.043        <-- this line will be skipped
+                <n Nj>  5.993  3.902  1.994  5.355  0.546  0.896  0.314        <-- this line will be skipped
+                hw:  1:1.000                                                   <-- this line will be skipped
+                -------------------------------------------------
+                """
+                line_split = line.split()
+                n_eig = int(line_split[0])  # Eigenvalue number. 1, 2, 3, ...
+                energy = float(line_split[2])
+                spin = int(line_split[line_split.index('J:') + 1].split('/')[0])    # 2*spin actually.
+                parity = int(line_split[line_split.index('prty') + 1])
+                parity = parity_integer_to_string(parity)
+                for line in lines:
+                    if ' T:' not in line: continue
+                    line_split = line.split()
+                    tt = int(line_split[line_split.index('T:') + 1].split('/')[0])
+                    E_data["filename"].append(filename)
+                    E_data["energy"].append(energy)
+                    E_data["spin"].append(spin)
+                    E_data["parity"].append(parity)
+                    E_data["n_eig"].append(n_eig)
+                    E_data["tt"].append(tt)
+                    break
+
+@lru_cache(maxsize=256)
 def spin_to_string(spin: int) -> str:
     """
     Divide spin by 2 and represent integer results as integers, and
@@ -129,6 +167,9 @@ def spin_to_string(spin: int) -> str:
     NOTE: Tempting to just do str(Fraction(spin/2)) on the negatives too
     and just let them be negative fractions.
 
+    The results are cached since only a handful of different spins are
+    converted, but very many times.
+
     Parameters
     ----------
     spin : int
@@ -150,42 +191,257 @@ def spin_to_string(spin: int) -> str:
 
     return res
 
-def read_transit_logfile_old(
+def _fixed_width_to_array(lines: List[str], columns: dict) -> np.ndarray:
+    """
+    Convert fixed width table lines to a structured array. All lines
+    are sliced and converted column by column in numpy instead of value
+    by value in Python.
+
+    Parameters
+    ----------
+    lines : List[str]
+        The table lines.
+
+    columns : dict
+        {name: (start, stop, dtype), ...} where 'line[start:stop]' is
+        the value of column 'name'.
+
+    Returns
+    -------
+    data : np.ndarray
+        Structured array with one field per entry in 'columns'.
+
+    Raises
+    ------
+    ValueError:
+        If any of the values cannot be converted to its dtype.
+    """
+    width = max(stop for _, stop, _ in columns.values())
+    raw = np.array([line.encode()[:width].ljust(width) for line in lines], dtype=f"S{width}")
+    chars = raw.view("S1").reshape(len(lines), width)   # One byte per element.
+    data = np.empty(
+        shape = len(lines),
+        dtype = [(name, dtype) for name, (_, _, dtype) in columns.items()]
+    )
+    for name, (start, stop, dtype) in columns.items():
+        data[name] = chars[:, start:stop].copy().view(f"S{stop - start}").ravel().astype(dtype)
+
+    return data
+
+@njit(cache=True)
+def _filter_transit_data(
+    spin_final: np.ndarray,
+    idx_1: np.ndarray,
+    E_final: np.ndarray,
+    spin_initial: np.ndarray,
+    idx_2: np.ndarray,
+    E_initial: np.ndarray,
+    dE: np.ndarray,
+    B_decay: np.ndarray,
+    B_excite: np.ndarray,
+    E_gs: float,
+    inv_B_weisskopf: float,
+    threshold: float,
+    is_diag: bool
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Numeric part of the transit log processing. Compiled with numba if
+    it is installed.
+
+    Parameters
+    ----------
+    spin_final, idx_1, E_final, spin_initial, idx_2, E_initial, dE,
+    B_decay, B_excite : np.ndarray
+        The columns of a transit log table.
+
+    E_gs : float
+        Ground state energy, subtracted from the initial and final
+        energies.
+
+    inv_B_weisskopf : float
+        1/B_weisskopf.
+
+    threshold : float
+        Transitions with B(W.u.) values below this threshold are
+        removed.
+
+    is_diag : bool
+        True if the initial and final wave functions are the same.
+        Transitions with negative dE are then removed since they are
+        duplicates.
+
+    Returns
+    -------
+    mask : np.ndarray
+        True for the transitions which are kept.
+
+    E_final, E_initial : np.ndarray
+        Energies relative to the ground state, with values smaller
+        than 1 keV set to zero.
+
+    B_weisskopf_decay, B_weisskopf_excite : np.ndarray
+        The reduced transition probabilities in Weisskopf units.
+    """
+    E_final = E_final - E_gs
+    E_initial = E_initial - E_gs
+    E_final[np.abs(E_final) < 1e-3] = 0.
+    E_initial[np.abs(E_initial) < 1e-3] = 0.
+    B_weisskopf_decay = B_decay*inv_B_weisskopf
+    B_weisskopf_excite = B_excite*inv_B_weisskopf
+
+    mask = (spin_final != spin_initial) | (idx_1 != idx_2)
+    if is_diag: mask = mask & (dE >= 0.0)
+    mask = mask & (B_weisskopf_decay >= threshold) & (B_weisskopf_excite >= threshold)
+
+    return mask, E_final, E_initial, B_weisskopf_decay, B_weisskopf_excite
+
+def _transit_data_to_output(
+    data: np.ndarray,
+    B_weisskopf: float,
+    parity_initial: str,
+    parity_final: str,
+    is_diag: bool,
+    n_jnp: dict,
+    E_gs: float
+    ) -> dict:
+    """
+    Filter the transitions read from a transit logfile and format the
+    remaining ones as summary file lines. The filtering is done on
+    whole columns at once, so that only the transitions which are kept
+    are handled in Python.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Structured array with at least the fields 'spin_final', 'idx_1',
+        'E_final', 'spin_initial', 'idx_2', 'E_initial', 'dE',
+        'B_decay', 'B_excite'.
+
+    B_weisskopf : float
+        Reduced transition probability in the Weisskopf estimate.
+
+    parity_initial : str
+        Parity of the initial states, '+' or '-'.
+
+    parity_final : str
+        Parity of the final states, '+' or '-'.
+
+    is_diag : bool
+        True if the initial and final wave functions are the same.
+
+    n_jnp : dict
+        n_jnp[(spin, parity, eigenstate number)] = the number of the
+        state among the states with the same spin and parity, counted
+        from the lowest energy. Made by 'collect_logs'.
+
+    E_gs : float
+        Ground state energy.
+
+    Returns
+    -------
+    out_e : dict
+        The summary file lines, keyed by a tuple which sorts the lines
+        by the energy of the upper state, then the energy of the lower
+        state, then by spins and indices.
+    """
+    mask, E_finals, E_initials, B_weisskopf_decays, B_weisskopf_excites = _filter_transit_data(
+        spin_final = data["spin_final"],
+        idx_1 = data["idx_1"],
+        E_final = data["E_final"],
+        spin_initial = data["spin_initial"],
+        idx_2 = data["idx_2"],
+        E_initial = data["E_initial"],
+        dE = data["dE"],
+        B_decay = data["B_decay"],
+        B_excite = data["B_excite"],
+        E_gs = E_gs,
+        inv_B_weisskopf = 1/B_weisskopf,
+        threshold = weisskopf_threshold,
+        is_diag = is_diag
+    )
+    columns = (
+        data["spin_final"], data["idx_1"], E_finals, data["spin_initial"],
+        data["idx_2"], E_initials, data["dE"], data["B_decay"],
+        data["B_excite"], B_weisskopf_decays, B_weisskopf_excites
+    )
+    out_e = {}
+    for (
+        spin_final, idx_1, E_final, spin_initial, idx_2, E_initial, dE,
+        B_decay, B_excite, B_weisskopf_decay, B_weisskopf_excite
+    ) in zip(*(column[mask].tolist() for column in columns)):
+        idx_1 = n_jnp[ (spin_final, parity_final, idx_1) ]
+        idx_2 = n_jnp[ (spin_initial, parity_initial, idx_2) ]
+
+        spin_initial_string = spin_to_string(spin_initial)
+        spin_final_string = spin_to_string(spin_final)
+
+        if dE > 0.0:
+            out = (
+                f"{spin_initial_string:4s} {parity_initial:1s} {idx_2:4d} {E_initial:9.3f}   "
+                f"{spin_final_string:4s} {parity_final:1s} {idx_1:4d} {E_final:9.3f} "
+                f"{dE:9.3f} {B_excite:15.8f} {B_weisskopf_excite:15.8f} "
+                f"{B_decay:15.8f} {B_weisskopf_decay:15.8f}\n"
+            )
+            key = (E_initial, E_final, spin_initial, idx_2, spin_final, idx_1)
+        else:
+            """
+            NOTE: What is this option used for? In what case is the
+            excitation energy negative?
+            """
+            out = (
+                f"{spin_final_string:4s} {parity_final:1s} {idx_1:4d} {E_final:9.3f}   "
+                f"{spin_initial_string:4s} {parity_initial:1s} {idx_2:4d} {E_initial:9.3f} "
+                f"{-dE:9.3f} {B_decay:15.8f} {B_weisskopf_decay:15.8f} "
+                f"{B_excite:15.8f} {B_weisskopf_excite:15.8f}\n"
+            )
+            key = (E_final, E_initial, spin_final, idx_1, spin_initial, idx_2)
+        out_e[key] = out
+
+    return out_e
+
+def _read_transit_tables(
     filename: str,
-    multipole_type: str
-    ):
+    multipole_types: List[str]
+    ) -> Tuple[dict, int]:
     """
-    Extract transit information from transit logfile. Old syntax style,
-    pre 2021-11-24.
+    Fetch the raw table lines of all the requested multipoles from a
+    transit logfile. The file is read only once, regardless of the
+    number of multipoles.
 
     Parameters
     ----------
     filename : str
         Filename of the log file.
 
-    multipole_type : str
+    multipole_types : List[str]
         The electromagnetic character and angular momentum of the gamma
-        radiation. Examples: 'E1', 'M1', 'E2'.
+        radiation. Examples: ['E1', 'M1', 'E2'].
+
+    Returns
+    -------
+    tables : dict
+        tables[multipole_type] = (lines, parity_initial, parity_final,
+        is_diag). Multipoles without a table in the logfile are not
+        included.
+
+    mass_save : int
+        The mass number. Is 0 if no mass number is found, meaning that
+        the logfile is incomplete.
 
     Raises
     ------
-    Exception:
+    RuntimeError:
         If mass != mass_save. Unsure why mass_save is here at all.
-
-    ValueError:
-        If the conversion of log file values to int or float cannot be
-        done. This indicates wrong log syntax.
     """
-    out_e = {}
+    tables = {}
     mass_save = 0           # NOTE: Unclear what this is used for.
     with open(filename, "r") as infile:
         for line in infile:
             """
             Fetch mass number, wave function filenames and parities.
-            Loop breaks when the line with parity information is found.
+            Only substring checks are done on each line. The few lines
+            which are actually used are split afterwards.
             """
-            line_split = line.split()
-            if len(line_split) == 0: continue   # Skip empty lines.
             if 'mass=' in line:
                 """
                 Fetch mass number. Example:
@@ -199,144 +455,161 @@ def read_transit_logfile_old(
                 if mass_save != mass: 
                     msg = f"ERROR  mass: {mass=}, {mass_save=}"
                     raise RuntimeError(msg)
-                
-                B_weisskopf, unit_weisskopf = weisskopf_unit(multipole_type, mass)
                 continue
 
-            if line_split[0] == 'fn_load_wave_l': 
-                filename_wavefunction_left = line_split[2]
+            if 'fn_load_wave_l' in line:
+                filename_wavefunction_left = line.split()[2]
                 continue
             
-            if line_split[0] == 'fn_load_wave_r': 
-                filename_wavefunction_right = line_split[2]
+            if 'fn_load_wave_r' in line:
+                filename_wavefunction_right = line.split()[2]
                 continue
             
-            if f"{multipole_type} transition" in line:
-                """
-                Example:
-                 E2 transition  e^2 fm^4  eff_charge=  1.3500  0.3500 parity -1 -1
-                   2Jf   idx  Ef        2Ji   idx  Ei          Ex        Mred.           B(EM )->        B(EM)<-         Mom.
-                   4     1   -387.729   4     1   -387.729     0.000    -20.43244863     83.49699137     83.49699137    -15.48643011
-                ...
-                """
-                parity_final = parity_integer_to_string(int(line_split[-2]))
-                parity_initial = parity_integer_to_string(int(line_split[-1]))
-                
-                if filename_wavefunction_left == filename_wavefunction_right:
-                    is_diag = True
-                else:
-                    is_diag = False
-                break
-
-            continue    # Included for readability.
-
-        infile.readline()    # Skip table header.
-        for line in infile:
+            if ' transition' not in line: continue
+            line_split = line.split()
+            multipole_type = line_split[0]
+            if (len(line_split) < 2) or (line_split[1] != "transition") or (multipole_type not in multipole_types) or (multipole_type in tables):
+                continue
             """
-            Extract transition data from log_*_tr_*.txt. Example:
-
-            NEW (higher decimal precision and only whitespace between values):
-            E2 transition  e^2 fm^4  eff_charge=  1.3500  0.3500 parity -1 -1
-            2Jf   idx  Ef        2Ji   idx  Ei          Ex        Mred.           B(EM )->        B(EM)<-         Mom.
-            4     1   -387.729   4     1   -387.729     0.000    -20.43244863     83.49699137     83.49699137    -15.48643011
-            4     1   -387.729   6     2   -387.461     0.267     10.55639593     22.28749899     15.91964213      0.00000000
-            4     1   -387.729   8     3   -387.196     0.532     14.53838975     42.27295529     23.48497516      0.00000000
-            4     1   -387.729   6     4   -387.080     0.649    -17.34631937     60.17895916     42.98497083      0.00000000
-            4     1   -387.729   8     5   -386.686     1.042    -11.24379628     25.28459094     14.04699497      0.00000000
-            ...
-
-            OLD:
-            ...
-            4(   2) -200.706 6(   4) -198.842   1.864    0.0147    0.0000    0.0000    0.0000
-            4(   2) -200.706 6(  10) -197.559   3.147   -0.0289    0.0002    0.0001    0.0000
+            Example:
+             E2 transition  e^2 fm^4  eff_charge=  1.3500  0.3500 parity -1 -1
+               2Jf   idx  Ef        2Ji   idx  Ei          Ex        Mred.           B(EM )->        B(EM)<-         Mom.
+               4     1   -387.729   4     1   -387.729     0.000    -20.43244863     83.49699137     83.49699137    -15.48643011
             ...
             """
-            line_split = line.split()
-            if not line_split: break    # End file read when blank lines are encountered.
-            if line.startswith("pn="):
+            parity_final = parity_integer_to_string(int(line_split[-2]))
+            parity_initial = parity_integer_to_string(int(line_split[-1]))
+            
+            if filename_wavefunction_left == filename_wavefunction_right:
+                is_diag = True
+            else:
+                is_diag = False
+
+            next(infile, None)  # Skip table header.
+            lines = []
+            for line in infile:
                 """
-                jonkd: I had to add this because 'pn' showed up in the
-                middle of the 'log_Ni56_gxpf1a_tr_m0p_m0p.txt' file
-                after trying (unsuccessfully) to run on Fram. Example:
+                Extract transition data from log_*_tr_*.txt. Example:
+
+                NEW (higher decimal precision and only whitespace between values):
+                E2 transition  e^2 fm^4  eff_charge=  1.3500  0.3500 parity -1 -1
+                2Jf   idx  Ef        2Ji   idx  Ei          Ex        Mred.           B(EM )->        B(EM)<-         Mom.
+                4     1   -387.729   4     1   -387.729     0.000    -20.43244863     83.49699137     83.49699137    -15.48643011
+                4     1   -387.729   6     2   -387.461     0.267     10.55639593     22.28749899     15.91964213      0.00000000
+                4     1   -387.729   8     3   -387.196     0.532     14.53838975     42.27295529     23.48497516      0.00000000
+                4     1   -387.729   6     4   -387.080     0.649    -17.34631937     60.17895916     42.98497083      0.00000000
+                4     1   -387.729   8     5   -386.686     1.042    -11.24379628     25.28459094     14.04699497      0.00000000
+                ...
 
+                OLD:
                 ...
                 4(   2) -200.706 6(   4) -198.842   1.864    0.0147    0.0000    0.0000    0.0000
-                pn= 1   # of mbits=            286
                 4(   2) -200.706 6(  10) -197.559   3.147   -0.0289    0.0002    0.0001    0.0000
                 ...
                 """
-                continue
-            
-            try:
-                spin_final = int(line[:2])
-                idx_1 = int(line[3:7])
-                spin_initial = int(line[17:19])
-                idx_2 = int(line[20:24])
-                dE = float(line[34:42]) # Gamma energy.
-                E_final = float(line[8:17]) - E_gs
-                E_initial = float(line[25:34]) - E_gs
-                B_decay = float(line[52:62])
-                B_excite = float(line[62:72])
-            except ValueError as err:
-                msg = f"\n{err.__str__()}"
-                msg += "\nThis might be due to wrong log file syntax."
-                msg += " Try using old_or_new='new' or 'both' as argument"
-                msg += " to collect_logs."
-                msg += f"\n{filename = }"
-                msg += f"\n{line = }"
-                raise ValueError(msg)
-
-            B_weisskopf_decay  = B_decay/B_weisskopf
-            B_weisskopf_excite = B_excite/B_weisskopf
-            if (spin_final == spin_initial) and (idx_1 == idx_2): continue
-            if is_diag and (dE < 0.0): continue
-            if (B_weisskopf_decay < weisskopf_threshold): continue
-            if (B_weisskopf_excite < weisskopf_threshold): continue
-            if abs(E_final) < 1e-3: E_final = 0.
-            if abs(E_initial) < 1e-3: E_initial = 0.
-            
-            idx_1 = n_jnp[ (spin_final, parity_final, idx_1) ]
-            idx_2 = n_jnp[ (spin_initial, parity_initial, idx_2) ]
-                
-            if dE > 0:
-                out = f"{spin_to_string(spin_initial):4s} "
-                out += f"{parity_initial:1s} "
-                out += f"{idx_2:4d} "
-                out += f"{E_initial:9.3f}   "
-                out += f"{spin_to_string(spin_final):4s} "
-                out += f"{parity_final:1s} "
-                out += f"{idx_1:4d} "
-                out += f"{E_final:9.3f} "
-                out += f"{dE:9.3f} "
-                out += f"{B_excite:15.8f} "
-                out += f"{B_weisskopf_excite:15.8f} "
-                out += f"{B_decay:15.8f} "
-                out += f"{B_weisskopf_decay:15.8f}\n"
-                key = E_initial + E_final * 1e-5 + spin_initial *1e-10 + idx_2*1e-11 + spin_final*1e-13 + idx_1*1e-14
-            else:
-                """
-                NOTE: What is this option used for? In what case is the
-                excitation energy negative?
-                """
-                out = f"{spin_to_string(spin_final):4s} "
-                out += f"{parity_final:1s} "
-                out += f"{idx_1:4d} "
-                out += f"{E_final:9.3f}   "
-                out += f"{spin_to_string(spin_initial):4s} "
-                out += f"{parity_initial:1s} "
-                out += f"{idx_2:4d} "
-                out += f"{E_initial:9.3f} "
-                out += f"{-dE:9.3f} "
-                out += f"{B_decay:15.8f} "
-                out += f"{B_weisskopf_decay:15.8f} "
-                out += f"{B_excite:15.8f} "
-                out += f"{B_weisskopf_excite:15.8f}\n"
-                key = E_final + E_initial * 1e-5 + spin_final *1.e-10 + idx_1*1.e-11 + spin_initial*1.e-12 + idx_2*1.e-14
-            out_e[key] = out
-
-    return unit_weisskopf, out_e, mass_save   
-
-def read_transit_logfile(filename: str, multipole_type: str):
+                if not line.strip(): break    # End of table when blank lines are encountered.
+                if line.startswith("pn="):
+                    """
+                    jonkd: I had to add this because 'pn' showed up in the
+                    middle of the 'log_Ni56_gxpf1a_tr_m0p_m0p.txt' file
+                    after trying (unsuccessfully) to run on Fram. Example:
+
+                    ...
+                    4(   2) -200.706 6(   4) -198.842   1.864    0.0147    0.0000    0.0000    0.0000
+                    pn= 1   # of mbits=            286
+                    4(   2) -200.706 6(  10) -197.559   3.147   -0.0289    0.0002    0.0001    0.0000
+                    ...
+                    """
+                    continue
+                lines.append(line)
+
+            tables[multipole_type] = (lines, parity_initial, parity_final, is_diag)
+            if len(tables) == len(multipole_types): break   # All requested tables are read.
+
+    return tables, mass_save
+
+def read_transit_logfile_old(
+    filename: str,
+    multipole_types: List[str],
+    *,
+    n_jnp: dict,
+    E_gs: float
+    ):
+    """
+    Extract transit information from transit logfile. Old syntax style,
+    pre 2021-11-24.
+
+    Parameters
+    ----------
+    filename : str
+        Filename of the log file.
+
+    multipole_types : List[str]
+        The electromagnetic character and angular momentum of the gamma
+        radiation. Examples: ['E1', 'M1', 'E2'].
+
+    n_jnp : dict
+        n_jnp[(spin, parity, eigenstate number)] = the number of the
+        state among the states with the same spin and parity, counted
+        from the lowest energy. Made by 'collect_logs'.
+
+    E_gs : float
+        Ground state energy.
+
+    Returns
+    -------
+    out_e : dict
+        out_e[multipole_type] = {key: summary file line, ...}.
+
+    mass_save : int
+        The mass number. Is 0 if the logfile is incomplete.
+
+    Raises
+    ------
+    Exception:
+        If mass != mass_save. Unsure why mass_save is here at all.
+
+    ValueError:
+        If the conversion of log file values to int or float cannot be
+        done. This indicates wrong log syntax.
+    """
+    out_e = {multipole_type: {} for multipole_type in multipole_types}
+    tables, mass_save = _read_transit_tables(filename, multipole_types)
+    if not mass_save: return out_e, mass_save
+
+    for multipole_type, (lines, parity_initial, parity_final, is_diag) in tables.items():
+        if not lines: continue
+
+        try:
+            data = _fixed_width_to_array(lines, transit_log_columns_old)
+        except ValueError as err:
+            msg = f"\n{err.__str__()}"
+            msg += "\nThis might be due to wrong log file syntax."
+            msg += " Try using old_or_new='new' or 'both' as argument"
+            msg += " to collect_logs."
+            msg += f"\n{filename = }"
+            raise ValueError(msg)
+
+        B_weisskopf, _ = weisskopf_unit(multipole_type, mass_save)
+        out_e[multipole_type] = _transit_data_to_output(
+            data = data,
+            B_weisskopf = B_weisskopf,
+            parity_initial = parity_initial,
+            parity_final = parity_final,
+            is_diag = is_diag,
+            n_jnp = n_jnp,
+            E_gs = E_gs
+        )
+
+    return out_e, mass_save
+
+def read_transit_logfile(
+    filename: str,
+    multipole_types: List[str],
+    *,
+    n_jnp: dict,
+    E_gs: float
+    ):
     """
     Extract transit information from transit logfile.
 
@@ -345,9 +618,25 @@ def read_transit_logfile(filename: str, multipole_type: str):
     filename : str
         Filename of the log file.
 
-    multipole_type : str
+    multipole_types : List[str]
         The electromagnetic character and angular momentum of the gamma
-        radiation. Examples: 'E1', 'M1', 'E2'.
+        radiation. Examples: ['E1', 'M1', 'E2'].
+
+    n_jnp : dict
+        n_jnp[(spin, parity, eigenstate number)] = the number of the
+        state among the states with the same spin and parity, counted
+        from the lowest energy. Made by 'collect_logs'.
+
+    E_gs : float
+        Ground state energy.
+
+    Returns
+    -------
+    out_e : dict
+        out_e[multipole_type] = {key: summary file line, ...}.
+
+    mass_save : int
+        The mass number. Is 0 if the logfile is incomplete.
 
     Raises
     ------
@@ -358,168 +647,137 @@ def read_transit_logfile(filename: str, multipole_type: str):
         If the conversion of log file values to int or float cannot be
         done. This indicates wrong log syntax.
     """
-    out_e = {}
-    mass_save = 0           # NOTE: Unclear what this is used for.
-    unit_weisskopf = None   # Stays None if the logfile is invalid.
-    with open(filename, "r") as infile:
-        for line in infile:
+    out_e = {multipole_type: {} for multipole_type in multipole_types}
+    tables, mass_save = _read_transit_tables(filename, multipole_types)
+    if not mass_save: return out_e, mass_save
+
+    for multipole_type, (lines, parity_initial, parity_final, is_diag) in tables.items():
+        if not lines: continue
+
+        try:
+            data = np.loadtxt(lines, dtype=transit_log_dtype, ndmin=1)
+        except ValueError as err:
+            msg = f"\n{err.__str__()}"
+            msg += "\nThis might be due to wrong log file syntax."
+            msg += " Try using old_or_new='old' or 'both' as argument to"
+            msg += " collect_logs."
+            msg += f"\n{filename = }"
+            raise ValueError(msg)
+
+        B_weisskopf, _ = weisskopf_unit(multipole_type, mass_save)
+        out_e[multipole_type] = _transit_data_to_output(
+            data = data,
+            B_weisskopf = B_weisskopf,
+            parity_initial = parity_initial,
+            parity_final = parity_final,
+            is_diag = is_diag,
+            n_jnp = n_jnp,
+            E_gs = E_gs
+        )
+
+    return out_e, mass_save
+
+def _read_energy_logfile_separately(filename: str) -> dict:
+    """
+    Read an energy logfile into a new E_data dictionary. Used for
+    reading several energy logfiles concurrently, since each thread
+    then needs its own dictionary.
+
+    Parameters
+    ----------
+    filename : str
+        The log filename.
+
+    Returns
+    -------
+    E_data : dict
+        See 'read_energy_logfile'.
+    """
+    E_data = {field: [] for field in E_data_fields}
+    read_energy_logfile(filename, E_data)
+    return E_data
+
+def _read_transit_logfile_any_syntax(
+    filename: str,
+    multipole_types: List[str],
+    old_or_new: str,
+    n_jnp: dict,
+    E_gs: float
+    ):
+    """
+    Read a transit logfile with the reader for the chosen log syntax.
+
+    Parameters
+    ----------
+    filename : str
+        Filename of the log file.
+
+    multipole_types : List[str]
+        The electromagnetic character and angular momentum of the gamma
+        radiation. Examples: ['E1', 'M1', 'E2'].
+
+    old_or_new : str
+        'new', 'old', or 'both'. See 'collect_logs'.
+
+    n_jnp : dict
+        n_jnp[(spin, parity, eigenstate number)] = the number of the
+        state among the states with the same spin and parity, counted
+        from the lowest energy. Made by 'collect_logs'.
+
+    E_gs : float
+        Ground state energy.
+
+    Returns
+    -------
+    out_e, mass_save
+        See 'read_transit_logfile'.
+    """
+    if old_or_new == "new":
+        return read_transit_logfile(filename, multipole_types, n_jnp=n_jnp, E_gs=E_gs)
+    elif old_or_new == "old":
+        return read_transit_logfile_old(filename, multipole_types, n_jnp=n_jnp, E_gs=E_gs)
+    elif old_or_new == "both":
+        try:
+            return read_transit_logfile_old(filename, multipole_types, n_jnp=n_jnp, E_gs=E_gs)
+        except ValueError:
             """
-            Fetch mass number, wave function filenames and parities.
-            Loop breaks when the line with parity information is found.
+            If a ValueError is raised inside read_transit_logfile_old,
+            it is due to the log file being new syntax styled.
             """
-            line_split = line.split()
-            if len(line_split) == 0: continue   # Skip empty lines.
-            if 'mass=' in line:
-                """
-                Fetch mass number. Example:
-                N. of valence protons and neutrons =  15 19   mass= 50   n,z-core     8    8
-                """
-                n = line.index('mass=')
-                mass = int(line[n + 5:n + 8])
-                if not mass_save:
-                    mass_save = mass
-                
-                if mass_save != mass: 
-                    msg = f"ERROR  mass: {mass=}, {mass_save=}"
-                    raise RuntimeError(msg)
-                
-                B_weisskopf, unit_weisskopf = weisskopf_unit(multipole_type, mass)
-                continue
+            return read_transit_logfile(filename, multipole_types, n_jnp=n_jnp, E_gs=E_gs)
 
-            if line_split[0] == 'fn_load_wave_l': 
-                filename_wavefunction_left = line_split[2]
-                continue
-            
-            if line_split[0] == 'fn_load_wave_r': 
-                filename_wavefunction_right = line_split[2]
-                continue
-            
-            if f"{multipole_type} transition" in line:
-                """
-                Example:
-                 E2 transition  e^2 fm^4  eff_charge=  1.3500  0.3500 parity -1 -1
-                   2Jf   idx  Ef        2Ji   idx  Ei          Ex        Mred.           B(EM )->        B(EM)<-         Mom.
-                   4     1   -387.729   4     1   -387.729     0.000    -20.43244863     83.49699137     83.49699137    -15.48643011
-                ...
-                """
-                parity_final = parity_integer_to_string(int(line_split[-2]))
-                parity_initial = parity_integer_to_string(int(line_split[-1]))
-                
-                if filename_wavefunction_left == filename_wavefunction_right:
-                    is_diag = True
-                else:
-                    is_diag = False
-                break
+def _n_reader_threads(n_files: int) -> int:
+    """
+    Number of threads for reading 'n_files' log files. The reading is
+    mostly waiting for the file system, so threads are used even though
+    the GIL is held during parsing.
+    """
+    if not flags["parallel"]: return 1
+    if n_files < 3: return 1    # Thread start-up is not worth it for a couple of files.
+    return min(32, 4*(os.cpu_count() or 1), n_files)
 
-            continue    # Included for readability.
+class _SerialExecutor:
+    """
+    Stand-in for ThreadPoolExecutor which runs the tasks in the calling
+    thread, lazily and in order.
+    """
+    def __enter__(self):
+        return self
 
-        infile.readline()    # Skip table header.
-        for line in infile:
-            """
-            Extract transition data from log_*_tr_*.txt. Example:
-
-            NEW (higher decimal precision and only whitespace between values):
-            E2 transition  e^2 fm^4  eff_charge=  1.3500  0.3500 parity -1 -1
-            2Jf   idx  Ef        2Ji   idx  Ei          Ex        Mred.           B(EM )->        B(EM)<-         Mom.
-            4     1   -387.729   4     1   -387.729     0.000    -20.43244863     83.49699137     83.49699137    -15.48643011
-            4     1   -387.729   6     2   -387.461     0.267     10.55639593     22.28749899     15.91964213      0.00000000
-            4     1   -387.729   8     3   -387.196     0.532     14.53838975     42.27295529     23.48497516      0.00000000
-            4     1   -387.729   6     4   -387.080     0.649    -17.34631937     60.17895916     42.98497083      0.00000000
-            4     1   -387.729   8     5   -386.686     1.042    -11.24379628     25.28459094     14.04699497      0.00000000
-            ...
+    def __exit__(self, *args):
+        return False
 
-            OLD:
-            ...
-            4(   2) -200.706 6(   4) -198.842   1.864    0.0147    0.0000    0.0000    0.0000
-            4(   2) -200.706 6(  10) -197.559   3.147   -0.0289    0.0002    0.0001    0.0000
-            ...
-            """
-            line_split = line.split()
-            if not line_split: break    # End file read when blank lines are encountered.
-            if line.startswith("pn="):
-                """
-                jonkd: I had to add this because 'pn' showed up in the
-                middle of the 'log_Ni56_gxpf1a_tr_m0p_m0p.txt' file
-                after trying (unsuccessfully) to run on Fram. Example:
+    def map(self, func: Callable, *iterables) -> Iterator:
+        return map(func, *iterables)
 
-                ...
-                4(   2) -200.706 6(   4) -198.842   1.864    0.0147    0.0000    0.0000    0.0000
-                pn= 1   # of mbits=            286
-                4(   2) -200.706 6(  10) -197.559   3.147   -0.0289    0.0002    0.0001    0.0000
-                ...
-                """
-                continue
-            try:
-                spin_final   = int(line_split[0])
-                idx_1        = int(line_split[1])
-                E_final      = float(line_split[2]) - E_gs
-                spin_initial = int(line_split[3])
-                idx_2        = int(line_split[4])
-                E_initial    = float(line_split[5]) - E_gs
-                dE           = float(line_split[6])
-                Mred         = float(line_split[7])
-                B_decay      = float(line_split[8])
-                B_excite     = float(line_split[9])
-                Mom          = float(line_split[10])
-            except ValueError as err:
-                msg = f"\n{err.__str__()}"
-                msg += "\nThis might be due to wrong log file syntax."
-                msg += " Try using old_or_new='old' or 'both' as argument to"
-                msg += " collect_logs."
-                msg += f"\n{filename = }"
-                msg += f"\n{line = }"
-                raise ValueError(msg)
-
-            B_weisskopf_decay  = B_decay/B_weisskopf
-            B_weisskopf_excite = B_excite/B_weisskopf
-
-            if (spin_final == spin_initial) and (idx_1 == idx_2): continue
-            if is_diag and (dE < 0.0): continue
-            if (B_weisskopf_decay < weisskopf_threshold): continue
-            if (B_weisskopf_excite < weisskopf_threshold): continue
-            if abs(E_final) < 1e-3: E_final = 0.
-            if abs(E_initial) < 1e-3: E_initial = 0.
-            
-            idx_1 = n_jnp[ (spin_final, parity_final, idx_1) ]
-            idx_2 = n_jnp[ (spin_initial, parity_initial, idx_2) ]
-                
-            if dE > 0.0:
-                out = f"{spin_to_string(spin_initial):4s} "
-                out += f"{parity_initial:1s} "
-                out += f"{idx_2:4d} "
-                out += f"{E_initial:9.3f}   "
-                out += f"{spin_to_string(spin_final):4s} "
-                out += f"{parity_final:1s} "
-                out += f"{idx_1:4d} "
-                out += f"{E_final:9.3f} "
-                out += f"{dE:9.3f} "
-                out += f"{B_excite:15.8f} "
-                out += f"{B_weisskopf_excite:15.8f} "
-                out += f"{B_decay:15.8f} "
-                out += f"{B_weisskopf_decay:15.8f}\n"
-                key = E_initial + E_final * 1e-5 + spin_initial *1e-10 + idx_2*1e-11 + spin_final*1e-13 + idx_1*1e-14
-            else:
-                """
-                NOTE: What is this option used for? In what case is the
-                excitation energy negative?
-                """
-                out = f"{spin_to_string(spin_final):4s} "
-                out += f"{parity_final:1s} "
-                out += f"{idx_1:4d} "
-                out += f"{E_final:9.3f}   "
-                out += f"{spin_to_string(spin_initial):4s} "
-                out += f"{parity_initial:1s} "
-                out += f"{idx_2:4d} "
-                out += f"{E_initial:9.3f} "
-                out += f"{-dE:9.3f} "
-                out += f"{B_decay:15.8f} "
-                out += f"{B_weisskopf_decay:15.8f} "
-                out += f"{B_excite:15.8f} "
-                out += f"{B_weisskopf_excite:15.8f}\n"
-                key = E_final + E_initial * 1e-5 + spin_final *1.e-10 + idx_1*1.e-11 + spin_initial*1.e-12 + idx_2*1.e-14
-            out_e[key] = out
-
-    return unit_weisskopf, out_e, mass_save
+def _reader_executor(n_files: int) -> Union[ThreadPoolExecutor, _SerialExecutor]:
+    """
+    Executor for reading 'n_files' files. The files are read serially
+    when only one reader thread would be used. See _n_reader_threads.
+    """
+    n_threads = _n_reader_threads(n_files)
+    if n_threads == 1: return _SerialExecutor()
+    return ThreadPoolExecutor(max_workers=n_threads)
 
 def check_multipolarities(path: str="."):
     """
@@ -645,33 +903,38 @@ def collect_logs(path: str=".", old_or_new: str="new"):
         msg = f"old_or_new must be in {allowed_old_or_new}. Got {old_or_new}."
         raise ValueError(msg)
 
-    energy_log_files = []
-    transit_log_files = []
-    isotopes = []
-    for elem in os.listdir(path):
-        # if elem.startswith("log_") and elem.endswith(".txt"):
-        if ("log_" in elem) and elem.endswith(".txt"):
+    energy_logs = []    # [(filename, filename split at '_' from the isotope name and on), ...].
+    transit_logs = []
+    isotopes = set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            elem = entry.name
+            # if elem.startswith("log_") and elem.endswith(".txt"):
+            if not (elem.endswith(".txt") and ("log_" in elem)): continue
+            if not entry.is_file(): continue    # File type is cached by scandir, no extra stat call.
             tmp = elem.split("_")
             isotope_index = tmp.index("log") + 1    # Isotope name is always after 'log'.
-            # if (tmp := elem.split("_")[1].lower()) not in isotopes:
-            if tmp[isotope_index] not in isotopes:
-                isotopes.append(tmp[isotope_index])
+            parts = tmp[isotope_index:]
+            isotopes.add(parts[0])
             if not "_tr_" in elem:
-                energy_log_files.append(f"{path}/{elem}")
-            elif "_tr_" in elem:
-                transit_log_files.append(f"{path}/{elem}")
+                energy_logs.append((elem, parts))
+            else:
+                transit_logs.append((elem, parts))
     
     if len(isotopes) > 1:
         print(f"Log files for different isotopes have been found in {path}")
-        msg = f"Found: {isotopes}. Your choice: "
+        msg = f"Found: {sorted(isotopes)}. Your choice: "
         while True:
             choice = input(msg)
             if choice in isotopes:
                 break
         
         # Remove all log files not of type 'choice'.
-        energy_log_files = [i for i in energy_log_files if choice in i.split("/")[-1].lower()]
-        transit_log_files = [i for i in transit_log_files if choice in i.split("/")[-1].lower()]
+        energy_logs = [(elem, parts) for elem, parts in energy_logs if parts[0] == choice]
+        transit_logs = [(elem, parts) for elem, parts in transit_logs if parts[0] == choice]
+
+    energy_log_files = [f"{path}/{elem}" for elem, _ in energy_logs]
+    transit_log_files = [f"{path}/{elem}" for elem, _ in transit_logs]
 
     if len(energy_log_files) == 0:
         msg = f"No energy log files in path '{path}'."
@@ -681,28 +944,42 @@ def collect_logs(path: str=".", old_or_new: str="new"):
         msg = f"No transit log files in path '{path}', only energy log files."
         warnings.warn(msg, RuntimeWarning)
 
-    E_data = {} # E_data[energy] = (log filename, spin, parity, eigenstate number, tt).
+    E_data = {field: [] for field in E_data_fields} # Parallel lists. See 'read_energy_logfile'.
     spin_parity_occurrences = {}    # Count the occurrences of each (spin, parity) pair.
+    n_jnp = {}  # n_jnp[(spin, parity, eigenstate number)] = number of the state among states of the same spin and parity.
     multipole_types = ["E1", "M1", "E2"]
     
     print("Loading energy log files...")
-    for i, log_file in enumerate(energy_log_files):
-        progress_message = f"Reading file {i + 1:3d} of {len(energy_log_files)},"
-        progress_message += f" '{log_file.split('/')[-1]}'"
-        print(progress_message)
-        read_energy_logfile(log_file, E_data)
-
-    energies = E_data.keys()
-    if len(energies) == 0:
+    with _reader_executor(len(energy_log_files)) as executor:
+        E_data_per_file = executor.map(_read_energy_logfile_separately, energy_log_files)
+        for i, (log_file, E_data_file) in enumerate(zip(energy_log_files, E_data_per_file)):
+            """
+            The files are read concurrently, but merged in the order of
+            'energy_log_files' so that the order of the states is the
+            same as for a sequential read.
+            """
+            progress_message = f"Reading file {i + 1:3d} of {len(energy_log_files)},"
+            progress_message += f" '{log_file.split('/')[-1]}'"
+            print(progress_message)
+            for field in E_data_fields:
+                E_data[field].extend(E_data_file[field])
+
+    if len(E_data["energy"]) == 0:
         msg = "No energy data has been read from energy logs!"
         raise RuntimeError(msg)
 
-    energies = sorted(energies)
-    for energy in energies:
+    # Sort by energy. A stable sort keeps states of equal energy in read order.
+    order = np.argsort(np.array(E_data["energy"]), kind="stable").tolist()
+    for field in E_data_fields:
+        E_data[field] = [E_data[field][i] for i in order]
+
+    N_Jp = []   # Number of each state among the states of the same spin and parity.
+    for spin, parity, n_eig in zip(E_data["spin"], E_data["parity"], E_data["n_eig"]):
         """
-        What does this loop actually do...?
+        Number the states of each (spin, parity) pair from the lowest
+        energy and up, and map the eigenstate numbers of the logs to
+        these numbers.
         """
-        filename, spin, parity, n_eig, tt = E_data[energy]
         spin_parity = (spin, parity)
         try:
             """
@@ -715,31 +992,35 @@ def collect_logs(path: str=".", old_or_new: str="new"):
             """
             spin_parity_occurrences[spin_parity] = 1
         n_jnp[ (spin, parity, n_eig) ] = spin_parity_occurrences[spin_parity]
-        E_data[energy] = filename, spin, parity, spin_parity_occurrences[spin_parity], tt
+        N_Jp.append(spin_parity_occurrences[spin_parity])
     
-    global E_gs
-    E_gs = energies[0]
+    E_gs = E_data["energy"][0]
 
+    _, parts = energy_logs[0]
+    isotope = parts[0]
+    model_space = parts[1]
+    summary_prefix = f"summary_{isotope}_{model_space}_"
     counter = 0
-    filename_without_path = energy_log_files[0].split("/")[-1]
-    isotope = filename_without_path.split("_")[1]
-    model_space = filename_without_path.split("_")[2]
-    while True:
+    for existing_summary in glob.glob(f"{glob.escape(path)}/{glob.escape(summary_prefix)}*.txt"):
         """
-        Create unique summary filename.
+        Create unique summary filename. The counter is set to one
+        more than the largest counter already in use, so that the
+        directory is only listed once.
         """
-        summary_filename = f"summary_{isotope}_{model_space}_{counter:03d}"
-        if os.path.isfile(f"{path}/{summary_filename}.txt"):
-            counter += 1
-        else:
-            summary_filename += ".txt"
-            break
+        existing_counter = os.path.basename(existing_summary)[len(summary_prefix):-4]
+        if existing_counter.isdigit():
+            counter = max(counter, int(existing_counter) + 1)
+    
+    summary_filename = f"{summary_prefix}{counter:03d}.txt"
     
     with open(f"{path}/{summary_filename}", "w") as outfile:
         outfile.write("\n Energy levels\n")
         outfile.write('\n    N   J     prty N_Jp T        E(MeV)    Ex(MeV)  log-file\n\n')
-        for i, energy in enumerate(energies):
-            filename, spin, parity, n_eig, tt = E_data[energy]
+        energy_rows = []    # All rows are written with a single writelines call.
+        for i, (filename, energy, spin, parity, n_eig, tt) in enumerate(zip(
+            E_data["filename"], E_data["energy"], E_data["spin"],
+            E_data["parity"], N_Jp, E_data["tt"]
+        )):
             out = f"{i + 1:5d}   "
             out += f"{spin_to_string(spin):5s} "
             out += f"{parity:1s} "
@@ -748,50 +1029,45 @@ def collect_logs(path: str=".", old_or_new: str="new"):
             out += f"{energy:10.3f} "
             out += f"{energy - E_gs:10.3f}   "
             out += f"{filename}\n"
-            outfile.write(out)
+            energy_rows.append(out)
+        outfile.writelines(energy_rows)
         outfile.write("\n")
 
         if len(transit_log_files) > 0:
             print("\nLoading transit log files...")
-            for multipole_type in multipole_types:
-                output_e = {}
-                
-                for i, filename in enumerate(transit_log_files):
+            output_e = {multipole_type: {} for multipole_type in multipole_types}
+            with _reader_executor(len(transit_log_files)) as executor:
+                results = executor.map(
+                    lambda filename: _read_transit_logfile_any_syntax(filename, multipole_types, old_or_new, n_jnp, E_gs),
+                    transit_log_files
+                )
+                for i, (filename, (out_e, mass)) in enumerate(zip(transit_log_files, results)):
+                    """
+                    All multipoles are read in the same pass over each
+                    logfile. The files are read concurrently and the
+                    results are collected in order.
+                    """
                     progress_message = f"Reading file {i + 1:3d} of {len(transit_log_files)},"
-                    progress_message += f" multipole: {multipole_type},"
                     progress_message += f" '{filename.split('/')[-1]}'"
                     print(progress_message)
-                    if old_or_new == "new":
-                        unit_weisskopf, out_e, mass = read_transit_logfile(filename, multipole_type)
-                    elif old_or_new == "old":
-                        unit_weisskopf, out_e, mass = read_transit_logfile_old(filename, multipole_type)
-                    elif old_or_new == "both":
-                        try:
-                            unit_weisskopf, out_e, mass = read_transit_logfile_old(filename, multipole_type)
-                        except ValueError:
-                            """
-                            If a ValueError is raised inside
-                            read_transit_logfile_old, it is due to the
-                            log file being new syntax styled.
-                            """
-                            unit_weisskopf, out_e, mass = read_transit_logfile(filename, multipole_type)
                     
-                    if unit_weisskopf is None:
+                    if not mass:
                         """
                         Incomplete and invalid logfile.
                         """
                         print(f"Incomplete logfile '{filename}'. Skipping...")
                         continue
                     
-                    output_e.update(out_e)
-                
+                    for multipole_type in multipole_types:
+                        output_e[multipole_type].update(out_e[multipole_type])
+            
+            for multipole_type in multipole_types:
                 B_weisskopf, unit_weisskopf = weisskopf_unit(multipole_type, mass)
                 outfile.write(f"B({multipole_type})  ( > {weisskopf_threshold:.1f} W.u.)  mass = {mass}    1 W.u. = {B_weisskopf:.1f} {unit_weisskopf}")
                 outfile.write(f"\n{unit_weisskopf} (W.u.)")
                 outfile.write(f"\nJ_i  pi_i idx_i Ex_i    J_f  pi_f idx_f Ex_f      dE         B({multipole_type})->         B({multipole_type})->[wu]     B({multipole_type})<-         B({multipole_type})<-[wu]\n")
 
-                for _, out in sorted(output_e.items()):
-                    outfile.write(out)
+                outfile.writelines([out for _, out in sorted(output_e[multipole_type].items())])
                 outfile.write("\n\n")
 
     return summary_filename
\ No newline at end of file
@@ -5,8 +5,9 @@ Author: Y. Tsunoda
 Modified by: https://github.com/GaffaSnobb
 """
 from functools import lru_cache
-import sys, math, time, multiprocessing
+import sys, math, time
 from typing import TextIO, Tuple
+from .parameters import get_pool
 
 def _readline_sk(
     fp: TextIO,
@@ -280,12 +281,11 @@ def count_dim(
     """
     timing_product_dimension = time.time()
     dim_mp = {}
-    with multiprocessing.Pool() as pool:
-        list_of_dicts = pool.map(
-            _parallel,
-            # [(dim_idp_mp[idp], dim_idn_mp[idn]) for idp, idn in total_partition]
-            [(i, dim_idp_mp[idx[0]], dim_idn_mp[idx[1]]) for i, idx in enumerate(total_partition)]
-        )
+    list_of_dicts = get_pool().map(
+        _parallel,
+        # [(dim_idp_mp[idp], dim_idn_mp[idn]) for idp, idn in total_partition]
+        [(i, dim_idp_mp[idx[0]], dim_idn_mp[idx[1]]) for i, idx in enumerate(total_partition)]
+    )
     for dict_ in list_of_dicts:
         for key in dict_:
             try:
@@ -364,6 +364,16 @@ def gamma_strength_function_average(
     """
     spin_parity_list = create_spin_parity_list(spins, parities) # To create a unique index for every [spin, parity] pair.
     n_unique_spin_parity_pairs = len(spin_parity_list)
+    spin_parity_indices = {(spin, parity): i for i, (spin, parity) in enumerate(spin_parity_list)}
+    """
+    2*spin and parity are small integers stored as float64. Convert
+    them once to int16 and int8, not once per transition and level in
+    the loops below.
+    """
+    transition_spins = transitions[:, spin_initial_or_final_idx].astype(np.int16).tolist()
+    transition_parities = transitions[:, parity_initial_or_final_idx].astype(np.int8).tolist()
+    level_spins = spins.astype(np.int16).tolist()
+    level_parities = parities.astype(np.int8).tolist()
     B_pixel_sum = np.zeros((n_bins, n_bins, n_unique_spin_parity_pairs))     # Summed B(..) values for each pixel.
     B_pixel_count = np.zeros((n_bins, n_bins, n_unique_spin_parity_pairs))   # The number of transitions.
     rho_ExJpi = np.zeros((n_bins, n_unique_spin_parity_pairs))  # (Ex, Jpi) matrix to store level density
@@ -439,9 +449,9 @@ def gamma_strength_function_average(
             2*spin_final, parity_final, idx_final, Ex_final, E_gamma,
             B(.., i->f), B(.., f<-i)]
         """
-        spin_initial_or_final = int(transitions[transition_idx, spin_initial_or_final_idx])  # Superfluous int casts?
-        parity_initial_or_final = int(transitions[transition_idx, parity_initial_or_final_idx])
-        spin_parity_idx = spin_parity_list.index([spin_initial_or_final, parity_initial_or_final])
+        spin_parity_idx = spin_parity_indices[
+            (transition_spins[transition_idx], transition_parities[transition_idx])
+        ]
 
         try:
             """
@@ -521,7 +531,7 @@ def gamma_strength_function_average(
         Ex_idx = int(Ex[levels_idx]/bin_width)
 
         spin_parity_idx = \
-            spin_parity_list.index([spins[levels_idx], parities[levels_idx]])
+            spin_parity_indices[(level_spins[levels_idx], level_parities[levels_idx])]
         
         rho_ExJpi[Ex_idx, spin_parity_idx] += 1
 
@@ -1,11 +1,13 @@
-import os, sys, multiprocessing, hashlib, ast, time, re
+import os, sys, hashlib, ast, time, re, json, mmap, tempfile, threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from fractions import Fraction
-from typing import Union, Callable, Tuple, Iterable
+from typing import Union, Callable, Tuple, Iterable, BinaryIO
 from itertools import chain
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from .collect_logs import collect_logs
+from .collect_logs import collect_logs, _reader_executor
 from .kshell_exceptions import KshellDataStructureError
 from .parameters import atomic_numbers, flags
 from .general_utilities import (
@@ -14,18 +16,151 @@ from .general_utilities import (
 )
 from .loaders import (
     _generic_loader, _load_energy_levels, _load_transition_probabilities,
-    _load_transition_probabilities_old, _load_transition_probabilities_jem
+    _load_transition_probabilities_old, _load_transition_probabilities_jem,
+    _find_summary_sections
 )
 
-def _generate_unique_identifier(path: str) -> str:
+_ptn_truncation_pattern = re.compile(r"\s*\S+\s+\[([\d,\s]+)\]\s*:((?:\s+-?\d+)+)\s*$")  # Particle-hole truncation line in .ptn files.
+_namelist_pattern = re.compile(r"^&input.*?$(.*?)(?:^&end|\Z)", re.DOTALL | re.MULTILINE)    # The &input namelist of a KSHELL shell script.
+_namelist_item_pattern = re.compile(r"^([^=\n]*)=([^=\n]*)", re.MULTILINE)   # 'key = value' lines of the namelist.
+_unique_identifier_cache = {}   # {(absolute directory path, ((filename, mtime), ...)): unique identifier}.
+_unique_identifier_indexed = set()  # {(absolute index file path, cache key), ...} of the identifiers known to be in an index file.
+_unique_identifier_index_lock = threading.Lock()    # Serialises read-merge-write of the unique identifier index file.
+_summary_sections = {   # {load tag: (summary file section header, attribute name), ...}, in the order of negative_spin_counts.
+    "levels": ("Energy", "levels"),
+    "BE1": ("B(E1)", "transitions_BE1"),
+    "BM1": ("B(M1)", "transitions_BM1"),
+    "BE2": ("B(E2)", "transitions_BE2"),
+}
+
+def _read_unique_identifier_index(index_fname: str) -> dict:
+    """
+    Read the unique identifier index. The index is always replaced
+    atomically, see _write_unique_identifier_index, so a complete file
+    is read even while another thread or process is updating it.
+
+    Parameters
+    ----------
+    index_fname : str
+        JSON file where the identifiers are stored between sessions.
+
+    Returns
+    -------
+    index : dict
+        {directory: [[[filename, mtime], ...], unique identifier], ...}.
+        Empty if there is no index yet or if it is broken.
+    """
+    try:
+        with open(index_fname, "r") as infile:
+            return json.load(infile)
+    except (FileNotFoundError, json.JSONDecodeError):
+        """
+        No index yet, or a broken one which will be overwritten.
+        """
+        return {}
+
+def _write_unique_identifier_index(index_fname: str, index_key: str, entry: list):
+    """
+    Add an entry to the unique identifier index. The index is re-read
+    and merged under a lock so that entries added concurrently are not
+    lost, and the new index is written to a temporary file in the same
+    directory which then replaces the old one.
+
+    Parameters
+    ----------
+    index_fname : str
+        JSON file where the identifiers are stored between sessions.
+
+    index_key : str
+        Absolute path of the directory of the entry.
+
+    entry : list
+        [[[filename, mtime], ...], unique identifier].
+    """
+    index_directory = os.path.dirname(index_fname) or "."
+    with _unique_identifier_index_lock:
+        index = _read_unique_identifier_index(index_fname)
+        index[index_key] = entry
+        fd, tmp_fname = tempfile.mkstemp(dir=index_directory, prefix=".unique_id_index_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as outfile:
+                json.dump(index, outfile)
+
+            os.replace(tmp_fname, index_fname)
+        except BaseException:
+            os.remove(tmp_fname)
+            raise
+
+def _save_npy_atomically(fname: str, arr: np.ndarray):
+    """
+    Save an array to a temporary file in the same directory which then
+    replaces 'fname'. Arrays which are memory mapped from an earlier
+    version of 'fname' keep the old file and are not changed or
+    truncated under them.
+
+    Parameters
+    ----------
+    fname : str
+        The .npy file name.
+
+    arr : np.ndarray
+        The array to save, without pickle.
+    """
+    fd, tmp_fname = tempfile.mkstemp(dir=os.path.dirname(fname) or ".", prefix=".npy_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as outfile:
+            np.save(file=outfile, arr=arr, allow_pickle=False)
+
+        os.replace(tmp_fname, fname)
+    except BaseException:
+        os.remove(tmp_fname)
+        raise
+
+def _index_unique_identifier(index_fname: str, index_key: str, entry: list, cache_key: tuple):
+    """
+    Add an entry to the unique identifier index if it is not already
+    there, and remember that the index has it so that later calls with
+    the same cache key do not read the index again. Nothing is done if
+    the directory of the index does not exist.
+
+    Parameters
+    ----------
+    index_fname : str
+        JSON file where the identifiers are stored between sessions.
+
+    index_key : str
+        Absolute path of the directory of the entry.
+
+    entry : list
+        [[[filename, mtime], ...], unique identifier].
+
+    cache_key : tuple
+        The key of the identifier in _unique_identifier_cache.
+    """
+    if not os.path.isdir(os.path.dirname(index_fname) or "."): return
+
+    if _read_unique_identifier_index(index_fname).get(index_key) != entry:
+        _write_unique_identifier_index(index_fname, index_key, entry)
+    
+    _unique_identifier_indexed.add((os.path.abspath(index_fname), cache_key))
+
+def _generate_unique_identifier(path: str, index_fname: Union[str, None] = None) -> str:
     """
     Generate a unique identifier based on the shell script and the
-    save_input file from KSHELL.
+    save_input file from KSHELL. The identifier is cached by the names
+    and modification times of these files, so that they are only read
+    and hashed again if they have been changed.
 
     Parameters
     ----------
     path : str
         The path to a summary file or a directory with a summary file.
+
+    index_fname : Union[str, None]
+        JSON file where the identifiers are stored between sessions,
+        keyed by directory. If the names and modification times of the
+        files match the stored ones, the stored identifier is used
+        without reading the files. Not used if None.
     """
     shell_file_content = ""
     save_input_content = ""
@@ -44,10 +179,41 @@ def _generate_unique_identifier(path: str) -> str:
     elif os.path.isdir(path):
         directory = path
 
-    for elem in os.listdir(directory):
+    with os.scandir(directory) as entries:
+        """
+        The modification times come from the directory entries, which
+        cache their stat results.
+        """
+        input_files = [
+            (entry.name, entry.stat().st_mtime_ns) for entry in entries
+            if entry.name.endswith(".sh") or ("save_input_ui.txt" in entry.name)
+        ]
+    input_fnames = [elem for elem, _ in input_files]
+    index_key = os.path.abspath(directory)  # Relative paths are different directories after os.chdir.
+    cache_key = (index_key, tuple(input_files))
+    file_times = [list(file_time) for file_time in cache_key[1]]  # JSON has no tuples.
+    if cache_key in _unique_identifier_cache:
+        """
+        The index might not have been written when the identifier was
+        cached, for example if tmp/ did not exist yet.
         """
-        Loop over all elements in the directory and find the shell
-        script and save_input file.
+        unique_id = _unique_identifier_cache[cache_key]
+        if (index_fname is not None) and ((os.path.abspath(index_fname), cache_key) not in _unique_identifier_indexed):
+            _index_unique_identifier(index_fname, index_key, [file_times, unique_id], cache_key)
+        
+        return unique_id
+
+    if index_fname is not None:
+        index = _read_unique_identifier_index(index_fname)
+        if (index_key in index) and (index[index_key][0] == file_times):
+            _unique_identifier_cache[cache_key] = index[index_key][1]
+            _unique_identifier_indexed.add((os.path.abspath(index_fname), cache_key))
+            return index[index_key][1]
+
+    for elem in input_fnames:
+        """
+        Loop over the shell scripts and save_input files in the
+        directory.
         """
         try:
             if elem.endswith(".sh"):
@@ -66,7 +232,16 @@ def _generate_unique_identifier(path: str) -> str:
     if (shell_file_content == "") and (save_input_content == ""):
         print(msg)
 
-    return hashlib.sha1((shell_file_content + save_input_content).encode()).hexdigest()
+    unique_id = hashlib.sha1(
+        (shell_file_content + save_input_content).encode(),
+        usedforsecurity = False
+    ).hexdigest()
+    _unique_identifier_cache[cache_key] = unique_id
+
+    if index_fname is not None:
+        _index_unique_identifier(index_fname, index_key, [file_times, unique_id], cache_key)
+
+    return unique_id
 
 class ReadKshellOutput:
     """
@@ -80,7 +255,8 @@ class ReadKshellOutput:
         state. [[E, 2*spin, parity, idx], ...]. idx counts how many
         times a state of that given spin and parity has occurred. The
         first 0+ state will have an idx of 1, the second 0+ will have an
-        idx of 2, etc.
+        idx of 2, etc. Stored column-major, so that each column is
+        contiguous in memory.
 
     transitions_BE1 : np.ndarray
         Transition data for BE1 transitions. Structure:
@@ -100,8 +276,16 @@ class ReadKshellOutput:
 
     transitions_BE2 : np.ndarray
         Transition data for BE2 transitions. Same structure as BE1.
+
+    Transition sections which are not in 'load' are None.
     """
-    def __init__(self, path: str, load_and_save_to_file: bool, old_or_new: str):
+    def __init__(self,
+        path: str,
+        load_and_save_to_file: bool,
+        old_or_new: str,
+        load: Tuple[str, ...] = ("levels", "BE1", "BM1", "BE2"),
+        parallel: Union[bool, None] = None
+        ):
         """
         Parameters
         ----------
@@ -122,6 +306,17 @@ class ReadKshellOutput:
             Old:
             J_i    Ex_i     J_f    Ex_f   dE        B(M1)->         B(M1)<- 
             2+(11) 18.393 2+(10) 17.791 0.602 0.1(  0.0) 0.1( 0.0)
+
+        load : Tuple[str, ...]
+            Which sections of the summary file to load. Any of
+            'levels', 'BE1', 'BM1', 'BE2'. Skipping the sections which
+            are not needed saves reading and parsing time. 'levels' is
+            always loaded, since the transitions are used together with
+            the levels, for example by gsf and level_density_plot.
+
+        parallel : Union[bool, None]
+            Toggle loading the sections of the summary file in threads
+            on / off. flags["parallel"] is used if None.
         """
 
         self.path = path.rstrip("/")    # Just in case, prob. not necessary.
@@ -140,19 +335,29 @@ class ReadKshellOutput:
         self.transitions_BE2 = None
         self.transitions_BE1 = None
         self.npy_path = "tmp"   # Directory for storing .npy files.
+        self.parallel = flags["parallel"] if (parallel is None) else parallel
+        self.load = tuple(  # Canonical order. The levels are always loaded, since the transitions are used together with them.
+            section for section in _summary_sections if (section in load) or (section == "levels")
+        )
         # Debug.
-        self.negative_spin_counts = np.array([0, 0, 0, 0])  # The number of skipped -1 spin states for [levels, BM1, BE2, BE1].
+        self.negative_spin_counts = [0, 0, 0, 0]  # The number of skipped -1 spin states for [levels, BE1, BM1, BE2].
 
         if isinstance(self.load_and_save_to_file, str) and (self.load_and_save_to_file != "overwrite"):
             msg = "Allowed values for 'load_and_save_to_file' are: 'True', 'False', 'overwrite'."
             msg += f" Got '{self.load_and_save_to_file}'."
             raise ValueError(msg)
 
+        if (not load) or any(section not in _summary_sections for section in load):
+            msg = f"'load' must be a non-empty selection of {tuple(_summary_sections)}."
+            msg += f" Got {load}."
+            raise ValueError(msg)
+
         if os.path.isdir(self.path):
             """
             If input 'path' is a directory. Look for summaries.
             """
-            summaries = [i for i in os.listdir(self.path) if "summary" in i]
+            with os.scandir(self.path) as entries:
+                summaries = [entry.name for entry in entries if ("summary" in entry.name) and entry.is_file()]
 
             if not summaries:
                 """
@@ -184,12 +389,15 @@ class ReadKshellOutput:
             msg = f"{self.path} is not a file or a directory!"
             tmp_directory = self.path.rsplit('/', 1)[0]
             if os.path.isdir(tmp_directory):
-                summaries = [i for i in os.listdir(tmp_directory) if "summary" in i]
+                with os.scandir(tmp_directory) as entries:
+                    tmp_fnames = [entry.name for entry in entries]  # Single pass over the directory.
+                
+                summaries = [i for i in tmp_fnames if "summary" in i]
                 if summaries:
                     msg += f" {len(summaries)} summary files were found in {tmp_directory}."
                     msg += f" {summaries}"
                 
-                logs = [i for i in os.listdir(tmp_directory) if i.startswith("log_")]
+                logs = [i for i in tmp_fnames if i.startswith("log_")]
                 if logs and (not summaries):
                     msg += f" Logs found in '{tmp_directory}'. Set path to '{tmp_directory}'"
                     msg += " to collect logs and load the summary file."
@@ -197,7 +405,10 @@ class ReadKshellOutput:
             raise RuntimeError(msg)
 
         self.base_fname = self.fname_summary.split(".")[0] # Base filename for .npy tmp files.
-        self.unique_id = _generate_unique_identifier(self.path) # Unique identifier for .npy files.
+        self.unique_id = _generate_unique_identifier(   # Unique identifier for .npy files.
+            path = self.path,
+            index_fname = f"{self.npy_path}/unique_id_index.json" if self.load_and_save_to_file else None
+        )
         self._extract_info_from_summary_fname()
         self._read_summary()
         
@@ -213,8 +424,7 @@ class ReadKshellOutput:
         """
         Extract nucleus and model space name.
         """
-        fname_split = self.fname_ptn.split("/")[-1]
-        fname_split = fname_split.split("_")
+        fname_split = os.path.basename(self.fname_ptn).split("_", 2)
         self.nucleus = fname_split[0]
         self.interaction = fname_split[1]
 
@@ -222,107 +432,58 @@ class ReadKshellOutput:
         """
         Read `KSHELL` partition file (.ptn) and extract proton
         partition, neutron partition, and particle-hole truncation data.
-        Save as instance attributes.
+        Save as instance attributes. The file is streamed through once,
+        and the partition lines are collected on the way and parsed
+        afterwards.
         """
-
-        line_number = 0
-        line_number_inner = 0
         self.truncation = []
 
+        partition_lines = {"# proton partition": [], "# neutron partition": []}
+        current_section = None  # A key of 'partition_lines', "truncation", or None.
         with open(self.fname_ptn, "r") as infile:
             for line in infile:
-                line_number += 1
-                
-                if line.startswith("# proton partition"):
-                    for line_inner in infile:
-                        """
-                        Read until next '#'.
-                        """
-                        line_number_inner += 1
-                        if line_inner.startswith("#"):
-                            line = line_inner
-                            break
-                    
-                    self.proton_partition = np.loadtxt(
-                        fname = self.fname_ptn,
-                        skiprows = line_number,
-                        max_rows = line_number_inner
-                    )
-                    line_number += line_number_inner
-                    line_number_inner = 0
+                if current_section == "truncation":
+                    """
+                    Loop over all particle-hole truncation lines.
+                    Example: '#   [1, 2, 3] :  0  2' means that orbits 1,
+                    2, and 3 are all truncated to occupations 0 to 2.
+                    """
+                    match = _ptn_truncation_pattern.match(line)
+                    if match is not None:
+                        occupation = [int(occ) for occ in match.group(2).split()]   # [min, max].
+                        for orbit in match.group(1).split(","):
+                            self.truncation.append((int(orbit), occupation))
+                        continue
+
+                    current_section = None  # Line does not contain truncation information.
+
+                if not line.startswith("#"):
+                    if current_section is not None:
+                        partition_lines[current_section].append(line)
+                    continue
                 
-                if line.startswith("# neutron partition"):
-                    for line_inner in infile:
-                        """
-                        Read until next '#'.
-                        """
-                        line_number_inner += 1
-                        if line_inner.startswith("#"):
-                            line = line_inner
-                            break
-                    
-                    self.neutron_partition = np.loadtxt(
-                        fname = self.fname_ptn,
-                        skiprows = line_number,
-                        max_rows = line_number_inner
-                    )
-                    line_number += line_number_inner
-                    line_number_inner = 0
+                """
+                A '#' line ends the current section and might start a
+                new one.
+                """
+                current_section = None
+                for header in partition_lines:
+                    if line.startswith(header):
+                        current_section = header
+                        break
 
                 if line.startswith("# particle-hole truncation"):
-                    for line_inner in infile:
-                        """
-                        Loop over all particle-hole truncation lines.
-                        """
-                        line_number += 1
-                        line_inner_split = line_inner.split()
-
-                        if (len(line_inner_split) < 2):
-                            """
-                            Condition will probably not get fulfilled.
-                            Safety precaution due to indexing in this
-                            loop.
-                            """
-                            break
-
-                        if (line_inner_split[1]).startswith("["):
-                            """
-                            '[' indicates that 'line_inner' is still
-                            containing truncation information.
-                            """
-                            for colon_index, elem in enumerate(line_inner_split):
-                                """
-                                Find the index of the colon ':' to
-                                decide the orbit numbers and occupation
-                                numbers.
-                                """
-                                if (elem == ":"): break
-
-                            occupation = [int(occ) for occ in line_inner_split[colon_index + 1:]]   # [min, max].
-                            orbit_numbers = "".join(line_inner_split[1:colon_index])
-                            orbit_numbers = orbit_numbers.replace("[", "")
-                            orbit_numbers = orbit_numbers.replace("]", "")
-                            orbit_numbers = orbit_numbers.replace(" ", "")  # This can prob. be removed because of the earlier split.
-                            orbit_numbers = orbit_numbers.split(",")
-                            orbit_numbers = [int(orbit) for orbit in orbit_numbers]
-                            
-                            for orbit in orbit_numbers:
-                                self.truncation.append((orbit, occupation))
-                        
-                        else:
-                            """
-                            Line does not contain '[' and thus does not
-                            contain truncation information.
-                            """
-                            break
+                    current_section = "truncation"
+        
+        self.proton_partition = np.loadtxt(partition_lines["# proton partition"])
+        self.neutron_partition = np.loadtxt(partition_lines["# neutron partition"])
 
     def _extract_info_from_summary_fname(self):
         """
         Extract nucleus and model space name.
         """
-        fname_split = self.fname_summary.split("/")[-1]  # Remove path.
-        fname_split = fname_split.split(".")[0] # Remove .txt.
-        fname_split = fname_split.split("_")
+        fname_split = os.path.basename(self.fname_summary)  # Remove path.
+        fname_split = fname_split.split(".", 1)[0].split("_", 3) # Remove .txt. Only the first three parts are needed.
         self.nucleus = fname_split[1]
         self.interaction = fname_split[2]
 
@@ -346,93 +507,100 @@ class ReadKshellOutput:
             except FileExistsError:
                 pass
 
-            with open(f"{self.npy_path}/README.txt", "w") as outfile:
-                msg = "This directory contains binary numpy data of KSHELL summary data."
-                msg += " The purpose is to speed up subsequent runs which use the same summary data."
-                msg += " It is safe to delete this entire directory if you have the original summary text file, "
-                msg += "though at the cost of having to read the summary text file over again which may take some time."
-                msg += " The ksutil.loadtxt parameter load_and_save_to_file = 'overwrite' will force a re-write of the binary numpy data."
-                outfile.write(msg)
+            readme_fname = f"{self.npy_path}/README.txt"
+            if not os.path.isfile(readme_fname):
+                with open(readme_fname, "w") as outfile:
+                    msg = "This directory contains binary numpy data of KSHELL summary data."
+                    msg += " The purpose is to speed up subsequent runs which use the same summary data."
+                    msg += " It is safe to delete this entire directory if you have the original summary text file, "
+                    msg += "though at the cost of having to read the summary text file over again which may take some time."
+                    msg += " The ksutil.loadtxt parameter load_and_save_to_file = 'overwrite' will force a re-write of the binary numpy data."
+                    outfile.write(msg)
         
-        levels_fname = f"{self.npy_path}/{self.base_fname}_levels_{self.unique_id}.npy"
-        transitions_BM1_fname = f"{self.npy_path}/{self.base_fname}_transitions_BM1_{self.unique_id}.npy"
-        transitions_BE2_fname = f"{self.npy_path}/{self.base_fname}_transitions_BE2_{self.unique_id}.npy"
-        transitions_BE1_fname = f"{self.npy_path}/{self.base_fname}_transitions_BE1_{self.unique_id}.npy"
-        debug_fname = f"{self.npy_path}/{self.base_fname}_debug_{self.unique_id}.npy"
-
-        fnames = [
-            levels_fname, transitions_BE2_fname, transitions_BM1_fname,
-            transitions_BE1_fname, debug_fname
-        ]
+        npy_fnames = {  # {load tag: .npy file name, ...}.
+            section: f"{self.npy_path}/{self.base_fname}_{attribute}_{self.unique_id}.npy"
+            for section, (_, attribute) in _summary_sections.items()
+        }
+        debug_fnames = {    # {load tag: skipped -1 spin state count file name, ...}.
+            section: f"{self.npy_path}/{self.base_fname}_debug_{attribute}_{self.unique_id}.txt"
+            for section, (_, attribute) in _summary_sections.items()
+        }
+        sections = list(_summary_sections)
+
+        fnames = [npy_fnames[section] for section in self.load] + [debug_fnames[section] for section in self.load]
 
         if self.load_and_save_to_file != "overwrite":
             """
             Do not load files if overwrite parameter has been passed.
             """
-            if all([os.path.isfile(fname) for fname in fnames]) and self.load_and_save_to_file:
+            if self.load_and_save_to_file and all(os.path.isfile(fname) for fname in fnames):
                 """
                 If all files exist, load them. If any of the files do
-                not exist, all will be generated.
+                not exist, all will be generated. The arrays are memory
+                mapped copy-on-write, so that only the parts which are
+                actually used are read from disk, and changes to the
+                arrays are not written back to the files.
                 """
-                self.levels = np.load(file=levels_fname, allow_pickle=True)
-                self.transitions_BM1 = np.load(file=transitions_BM1_fname, allow_pickle=True)
-                self.transitions_BE2 = np.load(file=transitions_BE2_fname, allow_pickle=True)
-                self.transitions_BE1 = np.load(file=transitions_BE1_fname, allow_pickle=True)
-                self.debug = np.load(file=debug_fname, allow_pickle=True)
+                for section in self.load:
+                    attribute = _summary_sections[section][1]
+                    setattr(self, attribute, np.load(file=npy_fnames[section], mmap_mode="c"))
+                    with open(debug_fnames[section], "r") as infile:
+                        self.negative_spin_counts[sections.index(section)] = int(infile.read())
+                
+                self._make_debug()
                 msg = "Summary data loaded from .npy!"
                 msg += " Use loadtxt parameter load_and_save_to_file = 'overwrite'"
                 msg += " to re-read data from the summary file."
                 print(msg)
                 return
 
+        if self.old_or_new == "new":
+            transitions_loader = _load_transition_probabilities
+        elif self.old_or_new == "old":
+            transitions_loader = _load_transition_probabilities_old
+        elif self.old_or_new == "jem":
+            transitions_loader = _load_transition_probabilities_jem
+        else:
+            msg = "'old_or_new' argument must be in ['old', 'new', 'jem']!"
+            msg += f" Got '{self.old_or_new}'."
+            raise ValueError(msg)
+
+        conditions = [_summary_sections[section][0] for section in self.load]
+        section_offsets = _find_summary_sections(self.path_summary, conditions)   # Single pass over the file.
         parallel_args = [
-            [self.path_summary, "Energy", "replace_this_entry_with_loader", 0],
-            [self.path_summary, "B(E1)", "replace_this_entry_with_loader", 1],
-            [self.path_summary, "B(M1)", "replace_this_entry_with_loader", 2],
-            [self.path_summary, "B(E2)", "replace_this_entry_with_loader", 3],
+            [
+                self.path_summary,
+                condition,
+                _load_energy_levels if (section == "levels") else transitions_loader,
+                thread_idx,
+                section_offsets.get(condition)
+            ]
+            for thread_idx, (section, condition) in enumerate(zip(self.load, conditions))
         ]
 
-        if self.old_or_new == "new":
-            parallel_args[0][2] = _load_energy_levels
-            parallel_args[1][2] = _load_transition_probabilities
-            parallel_args[2][2] = _load_transition_probabilities
-            parallel_args[3][2] = _load_transition_probabilities
+        if self.parallel and (len(parallel_args) > 1):
+            """
+            Threads instead of processes. No workers are spawned and
+            the loaded arrays are not pickled back to the main process.
+            """
+            with ThreadPoolExecutor(max_workers=len(parallel_args)) as pool:
+                loader_res = list(pool.map(partial(_generic_loader, parallel=True), parallel_args))
+        else:
+            loader_res = [_generic_loader(args, parallel=self.parallel) for args in parallel_args]
 
-        elif self.old_or_new == "old":
-            parallel_args[0][2] = _load_energy_levels
-            parallel_args[1][2] = _load_transition_probabilities_old
-            parallel_args[2][2] = _load_transition_probabilities_old
-            parallel_args[3][2] = _load_transition_probabilities_old
+        for section, (data, negative_spin_count) in zip(self.load, loader_res):
+            """
+            Column-major storage. The methods of this class and
+            general_utilities read one or two whole columns at a time
+            (energies, spins, B values), so each column is kept
+            contiguous in memory. Indexing is unchanged, levels[:, 0]
+            etc. The loaders already return column-major float64
+            arrays, for which this is a no-op.
+            """
+            setattr(self, _summary_sections[section][1], np.asfortranarray(data, dtype=np.float64))
+            self.negative_spin_counts[sections.index(section)] = negative_spin_count
 
-        elif self.old_or_new == "jem":
-            parallel_args[0][2] = _load_energy_levels
-            parallel_args[1][2] = _load_transition_probabilities_jem
-            parallel_args[2][2] = _load_transition_probabilities_jem
-            parallel_args[3][2] = _load_transition_probabilities_jem
-
-        if flags["parallel"]:
-            with multiprocessing.Pool() as pool:
-                pool_res = pool.map(_generic_loader, parallel_args)
-                self.levels, self.negative_spin_counts[0] = pool_res[0]
-                self.transitions_BE1, self.negative_spin_counts[1] = pool_res[1]
-                self.transitions_BM1, self.negative_spin_counts[2] = pool_res[2]
-                self.transitions_BE2, self.negative_spin_counts[3] = pool_res[3]
-        else:
-            self.levels, self.negative_spin_counts[0] = _generic_loader(parallel_args[0])
-            self.transitions_BE1, self.negative_spin_counts[1] = _generic_loader(parallel_args[1])
-            self.transitions_BM1, self.negative_spin_counts[2] = _generic_loader(parallel_args[2])
-            self.transitions_BE2, self.negative_spin_counts[3] = _generic_loader(parallel_args[3])
-
-        self.levels = np.array(self.levels)
-        self.transitions_BE1 = np.array(self.transitions_BE1)
-        self.transitions_BM1 = np.array(self.transitions_BM1)
-        self.transitions_BE2 = np.array(self.transitions_BE2)
-        self.debug = "DEBUG\n"
-        self.debug += f"skipped -1 states in levels: {self.negative_spin_counts[0]}\n"
-        self.debug += f"skipped -1 states in BE1: {self.negative_spin_counts[1]}\n"
-        self.debug += f"skipped -1 states in BM1: {self.negative_spin_counts[2]}\n"
-        self.debug += f"skipped -1 states in BE2: {self.negative_spin_counts[3]}\n"
-        self.debug = np.array(self.debug)
+        self._make_debug()
 
         if self.old_or_new == "jem":
             """
@@ -445,39 +613,72 @@ class ReadKshellOutput:
             msg += " JEM style syntax can be used!"
             raise NotImplementedError(msg)
             E_gs = abs(self.levels[0, 0])   # Can prob. just use ... -= E_gs
-            try:
-                self.transitions_BM1[:, 3] = E_gs - np.abs(self.transitions_BM1[:, 3])
-                self.transitions_BM1[:, 7] = E_gs - np.abs(self.transitions_BM1[:, 7])
-            except IndexError:
-                """
-                No BM1 transitions.
+            for transitions in (self.transitions_BM1, self.transitions_BE1, self.transitions_BE2):
                 """
-                pass
-            try:
-                self.transitions_BE1[:, 3] = E_gs - np.abs(self.transitions_BE1[:, 3])
-                self.transitions_BE1[:, 7] = E_gs - np.abs(self.transitions_BE1[:, 7])
-            except IndexError:
+                Both energy columns of each multipole in one operation.
+                Arrays without transitions are not 2D and are skipped,
+                as are multipoles which were not loaded.
                 """
-                No BE1 transitions.
-                """
-                pass
-            try:
-                self.transitions_BE2[:, 3] = E_gs - np.abs(self.transitions_BE2[:, 3])
-                self.transitions_BE2[:, 7] = E_gs - np.abs(self.transitions_BE2[:, 7])
-            except IndexError:
-                """
-                No BE2 transitions.
-                """
-                pass
+                if (transitions is None) or (transitions.ndim != 2): continue
+                transitions[:, [3, 7]] = E_gs - np.abs(transitions[:, [3, 7]])
 
             self.levels[:, 1] /= 2  # JEM style syntax has 2*J already. Without this correction it would be 4*J.
 
         if self.load_and_save_to_file:
-            np.save(file=levels_fname, arr=self.levels, allow_pickle=True)
-            np.save(file=transitions_BM1_fname, arr=self.transitions_BM1, allow_pickle=True)
-            np.save(file=transitions_BE2_fname, arr=self.transitions_BE2, allow_pickle=True)
-            np.save(file=transitions_BE1_fname, arr=self.transitions_BE1, allow_pickle=True)
-            np.save(file=debug_fname, arr=self.debug, allow_pickle=True)
+            """
+            Plain column-major float64 arrays are saved without pickle
+            so that they can be memory mapped, in the same layout, when
+            loaded.
+            """
+            for section in self.load:
+                """
+                The skipped -1 spin state count is saved per section,
+                so that loading a selection of sections does not
+                overwrite the counts of the other sections.
+                """
+                data = getattr(self, _summary_sections[section][1])
+                _save_npy_atomically(npy_fnames[section], data)
+                with open(debug_fnames[section], "w") as outfile:
+                    outfile.write(f"{self.negative_spin_counts[sections.index(section)]}\n")
+
+    def _make_debug(self):
+        """
+        Make the debug string from the skipped -1 spin state counts of
+        the loaded sections.
+        """
+        sections = list(_summary_sections)
+        self.debug = "DEBUG\n"
+        for section in self.load:
+            self.debug += f"skipped -1 states in {section}: {self.negative_spin_counts[sections.index(section)]}\n"
+
+    def _get_transitions(self, multipole_type: str) -> np.ndarray:
+        """
+        Get the transitions array of a multipole type.
+
+        Parameters
+        ----------
+        multipole_type : str
+            'E1', 'M1' or 'E2'.
+
+        Raises
+        ------
+        ValueError
+            If 'multipole_type' is not a valid multipole type.
+        
+        RuntimeError
+            If the transitions of 'multipole_type' were not loaded.
+        """
+        if multipole_type not in ("E1", "M1", "E2"):
+            msg = "'multipole_type' must be either 'E1', 'M1' or 'E2'."
+            msg += f" Got {multipole_type}."
+            raise ValueError(msg)
+        
+        transitions = getattr(self, f"transitions_B{multipole_type}")
+        if transitions is None:
+            msg = f"B({multipole_type}) transitions were not loaded."
+            raise RuntimeError(msg)
+
+        return transitions
 
     def level_plot(self,
         include_n_levels: int = 1000,
@@ -594,11 +795,6 @@ class ReadKshellOutput:
         See gamma_strength_function_average in general_utilities.py
         for parameter descriptions.
         """
-        transitions_dict = {
-            "M1": self.transitions_BM1,
-            "E2": self.transitions_BE2,
-            "E1": self.transitions_BE1
-        }
         is_loaded = False
         gsf_unique_string = f"{bin_width}{Ex_min}{Ex_max}{multipole_type}"
         gsf_unique_string += f"{prefactor_E1}{prefactor_M1}{prefactor_E2}"
@@ -613,7 +809,7 @@ class ReadKshellOutput:
         if return_n_transitions:
             fnames.append(n_transitions_fname)
         
-        if all([os.path.isfile(fname) for fname in fnames]) and self.load_and_save_to_file and (self.load_and_save_to_file != "overwrite"):
+        if self.load_and_save_to_file and (self.load_and_save_to_file != "overwrite") and all(os.path.isfile(fname) for fname in fnames):
             """
             If all these conditions are met, all arrays will be loaded
             from file. If any of these conditions are NOT met, all
@@ -631,7 +827,7 @@ class ReadKshellOutput:
         else:
             tmp = gamma_strength_function_average(
                 levels = self.levels,
-                transitions = transitions_dict[multipole_type],
+                transitions = self._get_transitions(multipole_type),
                 bin_width = bin_width,
                 Ex_min = Ex_min,
                 Ex_max = Ex_max,
@@ -732,13 +928,7 @@ class ReadKshellOutput:
             Choose the multipolarity of the transitions. 'E1', 'M1',
             'E2'.
         """
-        transitions_dict = {
-            "E1": self.transitions_BE1,
-            "M1": self.transitions_BM1,
-            "E2": self.transitions_BE2,
-        }
-        
-        return porter_thomas(transitions_dict[multipole_type], **kwargs)
+        return porter_thomas(self._get_transitions(multipole_type), **kwargs)
 
     def porter_thomas_Ei_plot(self,
         Ei_range_min: float = 5,
@@ -1136,12 +1326,6 @@ class ReadKshellOutput:
         else:
             j_list_default = False
 
-        transitions_dict = {
-            "E1": self.transitions_BE1,
-            "M1": self.transitions_BM1,
-            "E2": self.transitions_BE2,
-        }
-
         colors = ["blue", "royalblue", "lightsteelblue"]
         if isinstance(multipole_type, str):
             multipole_type = [multipole_type]
@@ -1159,7 +1343,7 @@ class ReadKshellOutput:
                 Default j_lists values.
                 """
                 j_lists = []
-                for elem in np.unique(transitions_dict[multipole_type[0]][:, 0]):
+                for elem in np.unique(self._get_transitions(multipole_type[0])[:, 0]):
                     j_lists.append([elem/2])
 
                 j_lists = j_lists[:3]   # _porter_thomas_j_plot_calculator supports max. 3 lists of j values.
@@ -1237,7 +1421,7 @@ class ReadKshellOutput:
                 Default j_lists values.
                 """
                 j_lists = []
-                for elem in np.unique(transitions_dict[multipole_type[0]][:, 0]):
+                for elem in np.unique(self._get_transitions(multipole_type[0])[:, 0]):
                     j_lists.append([elem/2])
 
                 j_lists = j_lists[:3]   # _porter_thomas_j_plot_calculator supports max. 3 lists of j values.
@@ -1296,7 +1480,7 @@ class ReadKshellOutput:
                 Default j_lists values.
                 """
                 j_lists = []
-                for elem in np.unique(transitions_dict[multipole_type[1]][:, 0]):
+                for elem in np.unique(self._get_transitions(multipole_type[1])[:, 0]):
                     j_lists.append([elem/2])
 
                 j_lists = j_lists[:3]   # _porter_thomas_j_plot_calculator supports max. 3 lists of j values.
@@ -1609,12 +1793,7 @@ class ReadKshellOutput:
             is_loaded = True
 
         else:
-            transitions_dict = {
-                "E1": self.transitions_BE1,
-                "M1": self.transitions_BM1,
-                "E2": self.transitions_BE2,
-            }
-            transitions = transitions_dict[multipole_type]
+            transitions = self._get_transitions(multipole_type)
 
             if filter_spins is None:
                 initial_j = np.unique(transitions[:, 0])
@@ -1746,12 +1925,6 @@ class ReadKshellOutput:
         else:
             j_list_default = False
             
-        transitions_dict = {
-            "E1": self.transitions_BE1,
-            "M1": self.transitions_BM1,
-            "E2": self.transitions_BE2,
-        }
-
         if isinstance(multipole_type, str):
             multipole_type = [multipole_type]
         
@@ -1772,7 +1945,7 @@ class ReadKshellOutput:
                 """
                 Choose all available angular momenta as default.
                 """
-                j_list = np.unique(transitions_dict[multipole_type[i]][:, 0])/2
+                j_list = np.unique(self._get_transitions(multipole_type[i])[:, 0])/2
                 j_list.sort()   # Just in case.
 
             bins, gsf, bins_all_j, gsf_all_j = self._brink_axel_j_calculator(
@@ -1881,7 +2054,9 @@ class ReadKshellOutput:
 def loadtxt(
     path: str,
     load_and_save_to_file: Union[bool, str] = True,
-    old_or_new = "new"
+    old_or_new = "new",
+    load: Tuple[str, ...] = ("levels", "BE1", "BM1", "BE2"),
+    parallel: Union[bool, None] = None
     ) -> ReadKshellOutput:
     """
     Wrapper for using ReadKshellOutput class as a function.
@@ -1906,6 +2081,15 @@ def loadtxt(
         J_i    Ex_i     J_f    Ex_f   dE        B(M1)->         B(M1)<- 
         2+(11) 18.393 2+(10) 17.791 0.602 0.1(  0.0) 0.1( 0.0)
 
+    load : Tuple[str, ...]
+        Which sections of the summary file to load. Any of 'levels',
+        'BE1', 'BM1', 'BE2'. 'levels' is always loaded. The attributes
+        of the sections which are not loaded are None.
+
+    parallel : Union[bool, None]
+        Toggle loading the sections of the summary file in threads on /
+        off. flags["parallel"] is used if None.
+
     Returns
     -------
     res : ReadKshellOutput
@@ -1918,7 +2102,7 @@ def loadtxt(
         msg += f" Got '{old_or_new}'."
         raise ValueError(msg)
 
-    res = ReadKshellOutput(path, load_and_save_to_file, old_or_new)
+    res = ReadKshellOutput(path, load_and_save_to_file, old_or_new, load, parallel)
 
     loadtxt_time = time.perf_counter() - loadtxt_time
     if flags["debug"]:
@@ -1926,6 +2110,144 @@ def loadtxt(
 
     return res
 
+def _tail_lines(infile: BinaryIO, n_lines: int = 20, block_size: int = 4096) -> list[str]:
+    """
+    Get the last lines of a file. The file is read in blocks backwards
+    from the end until enough lines are found, so that only the end of
+    the file is read.
+
+    Parameters
+    ----------
+    infile : BinaryIO
+        The file, opened in binary mode.
+
+    n_lines : int
+        The number of lines to get.
+
+    block_size : int
+        The number of bytes to read at a time.
+    """
+    blocks = []
+    n_newlines = 0
+    position = infile.seek(0, os.SEEK_END)
+    while (position > 0) and (n_newlines <= n_lines):
+        """
+        One more newline than lines, since the last line is usually
+        terminated by a newline as well.
+        """
+        read_size = min(block_size, position)
+        position -= read_size
+        infile.seek(position)
+        blocks.append(infile.read(read_size))
+        n_newlines += blocks[-1].count(b"\n")
+
+    return b"".join(reversed(blocks)).decode(errors="replace").splitlines()[-n_lines:]
+
+def _find_line(
+    infile: BinaryIO,
+    prefix: bytes,
+    block_size: int = 65536,
+    mmap_threshold: int = 65536
+    ) -> Union[str, None]:
+    """
+    Get the first line of a file which starts with 'prefix'. The file
+    is searched from the current position and the search stops at the
+    first match, so that the rest of the file is not read. Large files
+    are memory mapped and searched directly in the page cache, smaller
+    files are read in blocks.
+
+    Parameters
+    ----------
+    infile : BinaryIO
+        The file, opened in binary mode.
+
+    prefix : bytes
+        The start of the line to find.
+
+    block_size : int
+        The number of bytes to read at a time.
+
+    mmap_threshold : int
+        Files with more than this many bytes after the current position
+        are memory mapped instead of read in blocks.
+
+    Returns
+    -------
+    line : Union[str, None]
+        The line, without the newline. None if no line starts with
+        'prefix'.
+    """
+    marker = b"\n" + prefix
+    position = infile.tell()
+    if os.fstat(infile.fileno()).st_size - position > mmap_threshold:
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[position:position + len(prefix)] == prefix:
+                start = position
+            elif (start := mm.find(marker, position)) != -1:
+                start += 1
+            else:
+                return None
+
+            if (end := mm.find(b"\n", start)) == -1: end = len(mm)
+            return mm[start:end].decode(errors="replace")
+
+    buffer = b"\n"  # So that the first line can match as well.
+    while True:
+        block = infile.read(block_size)
+        buffer += block
+        if (start := buffer.find(marker)) != -1:
+            start += 1
+            while ((end := buffer.find(b"\n", start)) == -1) and (block := infile.read(block_size)):
+                """
+                The line continues in the next block.
+                """
+                buffer += block
+            
+            return buffer[start:(len(buffer) if end == -1 else end)].decode(errors="replace")
+
+        if not block: return None
+        buffer = buffer[-len(marker):]  # A match might span two blocks.
+
+@lru_cache(maxsize=1024)
+def _parse_log(path: str, mtime_ns: int) -> Tuple[Tuple[str, ...], Union[str, None]]:
+    """
+    Read the lines with timing data and memory data from a KSHELL log
+    file, opening the file only once for both. Cached by path and
+    modification time, so that _get_timing_data and _get_memory_usage
+    of the same file share the result, and changed files are re-read.
+    The cache is bounded, so that the entries of old modification times
+    and of files which are not used any more are evicted.
+
+    Parameters
+    ----------
+    path : str
+        Path to a single log file.
+
+    mtime_ns : int
+        Modification time of the file. Part of the cache key only.
+
+    Returns
+    -------
+    tail : Tuple[str, ...]
+        The final 20 lines of the file, which contain the timing data.
+
+    memory_line : Union[str, None]
+        The 'Total Memory for Lanczos vectors:' line. None if the line
+        is not found, and for transit logs since they do not have it.
+    """
+    memory_line = None
+    with open(path, "rb") as infile:
+        if "tr" not in path:
+            """
+            KSHELL log. The memory line is close to the start of the
+            file.
+            """
+            memory_line = _find_line(infile, b"Total Memory for Lanczos vectors:")
+        
+        tail = tuple(_tail_lines(infile, 20))
+
+    return tail, memory_line
+
 def _get_timing_data(path: str):
     """
     Get timing data from KSHELL log files.
@@ -1957,8 +2279,7 @@ def _get_timing_data(path: str):
     if not os.path.isfile(path):
         raise FileNotFoundError(path)
 
-    res = os.popen(f'tail -n 20 {path}').read()    # Get the final 10 lines.
-    res = res.split("\n")
+    res = _parse_log(path, os.stat(path).st_mtime_ns)[0]    # Get the final 20 lines.
     total = None
     
     if "_tr_" not in path:
@@ -2013,16 +2334,14 @@ def _get_memory_usage(path: str) -> Union[float, None]:
         """
         KSHELL log.
         """
-        with open(path, "r") as infile:
-            for line in infile:
-                if line.startswith("Total Memory for Lanczos vectors:"):
-                    try:
-                        total = float(line.split()[-2])
-                    except ValueError:
-                        msg = f"Error reading memory usage from '{path}'."
-                        msg += f" Got '{line.split()[-2]}'."
-                        raise KshellDataStructureError(msg)
-                    break
+        line = _parse_log(path, os.stat(path).st_mtime_ns)[1]
+        if line is not None:
+            try:
+                total = float(line.split()[-2])
+            except ValueError:
+                msg = f"Error reading memory usage from '{path}'."
+                msg += f" Got '{line.split()[-2]}'."
+                raise KshellDataStructureError(msg)
         
     elif "tr" in path:
         """
@@ -2039,15 +2358,174 @@ def _get_memory_usage(path: str) -> Union[float, None]:
 def _sortkey(filename):
     """
     Key for sorting filenames based on angular momentum and parity.
-    Example filename: 'log_Sc44_GCLSTsdpfsdgix5pn_j0n.txt'
-    (angular momentum  = 0). 
+    Example filenames: 'log_Sc44_GCLSTsdpfsdgix5pn_j0n.txt' and
+    'log_Ar30_usda_m0p.txt' (angular momentum  = 0). Any single letter
+    is accepted before the angular momentum.
+    """
+    stem = filename.rpartition("_")[2].partition(".")[0]    # Example: 'j0n'.
+    if (not stem[:1].isalpha()) or (not stem[1:-1].isdecimal()) or (stem[-1:] not in ("p", "n")):
+        msg = f"Not able to read the angular momentum from '{filename}'!"
+        raise ValueError(msg)
+    
+    return int(stem[1:-1])
+
+@lru_cache(maxsize=None)
+def _scan_log_dir(path: str, mtime_ns: int) -> Tuple[Tuple[Tuple[int, str], ...], Tuple[Tuple[int, str], ...]]:
+    """
+    Find the log files in a directory, split by parity and sorted by
+    angular momentum. The sort key of each file is computed once and
+    returned along with the file name. Cached by path and modification time of the
+    directory, which changes when files are added, removed or
+    renamed.
+
+    Parameters
+    ----------
+    path : str
+        Path to a directory of log files.
+
+    mtime_ns : int
+        Modification time of the directory. Part of the cache key only.
+
+    Returns
+    -------
+    filenames_negative : Tuple[Tuple[int, str], ...]
+        ((2*spin, filename), ...) of the log files of negative parity.
+
+    filenames_positive : Tuple[Tuple[int, str], ...]
+        ((2*spin, filename), ...) of the log files of positive parity.
+    """
+    filenames_negative = []
+    filenames_positive = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            """
+            Select only log files in path.
+            """
+            elem = entry.name
+            if not elem.endswith(".txt"): continue
+            
+            tmp = elem.split("_", 2)
+            if (tmp[0] != "log") and ((len(tmp) < 2) or (tmp[1] != "log")): continue
+            
+            parity = elem.rpartition("_")[2].partition(".")[0][-1:]  # Example: 'log_Sc44_GCLSTsdpfsdgix5pn_j0n.txt' -> 'n'.
+            if parity == "n":
+                filenames_negative.append((_sortkey(elem), elem))
+            elif parity == "p":
+                filenames_positive.append((_sortkey(elem), elem))
+    
+    filenames_negative.sort()
+    filenames_positive.sort()
+
+    return tuple(filenames_negative), tuple(filenames_positive)
+
+def _collect_totals(
+    path: str,
+    func: Callable
+    ) -> Tuple[np.ndarray, np.ndarray, Tuple[Tuple[int, str], ...], Tuple[Tuple[int, str], ...]]:
+    """
+    Apply 'func' to all the log files in a directory.
+
+    Parameters
+    ----------
+    path : str
+        Path to a directory of log files.
+
+    func : Callable
+        _get_timing_data or _get_memory_usage.
+
+    Returns
+    -------
+    total_negative : np.ndarray
+        The values of the negative parity log files.
+
+    total_positive : np.ndarray
+        The values of the positive parity log files.
+
+    filenames_negative : Tuple[Tuple[int, str], ...]
+        ((2*spin, filename), ...) of the negative parity log files, in
+        the order of 'total_negative'.
+
+    filenames_positive : Tuple[Tuple[int, str], ...]
+        ((2*spin, filename), ...) of the positive parity log files, in
+        the order of 'total_positive'.
     """
-    tmp = filename.split("_")[-1]
-    tmp = tmp.split(".")[0]
-    # parity = tmp[-1]
-    spin = int(tmp[1:-1])
-    # return f"{spin:03d}{parity}"    # Examples: 000p, 000n, 016p, 016n
-    return spin
+    filenames_negative, filenames_positive = _scan_log_dir(path, os.stat(path).st_mtime_ns)
+    paths = [f"{path}/{elem}" for _, elem in chain(filenames_negative, filenames_positive)]
+    with _reader_executor(len(paths)) as executor:
+        """
+        The log files of both parities are read concurrently in a
+        single dispatch, and the results are split by parity
+        afterwards. Threads, so that the _parse_log cache is shared.
+        map keeps the order of 'paths'.
+        """
+        totals = np.fromiter(executor.map(func, paths), dtype=float, count=len(paths))
+    
+    total_negative = totals[:len(filenames_negative)]
+    total_positive = totals[len(filenames_negative):]
+
+    return total_negative, total_positive, filenames_negative, filenames_positive
+
+def _spin_label(spin: int) -> str:
+    """
+    Format 2*spin as spin. Examples: 4 -> '2', 3 -> '3/2'.
+    """
+    return f"{spin//2}" if (spin%2 == 0) else f"{spin}/2"
+
+def _plot_totals(
+    total_negative: np.ndarray,
+    total_positive: np.ndarray,
+    filenames_negative: Tuple[Tuple[int, str], ...],
+    filenames_positive: Tuple[Tuple[int, str], ...]
+    ):
+    """
+    Bar plot of the values of each log file, as returned by
+    _collect_totals.
+    """
+    xticks_negative = ["sum"] + [_spin_label(spin) for spin, _ in filenames_negative]
+    xticks_positive = ["sum"] + [_spin_label(spin) for spin, _ in filenames_positive]
+    sum_total_negative = total_negative.sum()
+    sum_total_positive = total_positive.sum()
+    
+    fig0, ax0 = plt.subplots(ncols=1, nrows=2)
+    fig1, ax1 = plt.subplots(ncols=1, nrows=2)
+
+    bars = ax0[0].bar(
+        xticks_negative,
+        [sum_total_negative/3600] + (total_negative/3600).tolist(),
+        color = "black",
+    )
+    ax0[0].set_title("negative")
+    ax0[0].bar_label(bars, fmt='%.3f')
+    
+    bars = ax1[0].bar(
+        xticks_negative,
+        [sum_total_negative/sum_total_negative] + (total_negative/sum_total_negative).tolist(),
+        color = "black",
+    )
+    ax1[0].set_title("negative")
+    ax1[0].bar_label(bars, fmt='%.3f')
+    
+    bars = ax0[1].bar(
+        xticks_positive,
+        [sum_total_positive/3600] + (total_positive/3600).tolist(),
+        color = "black",
+    )
+    ax0[1].set_title("positive")
+    ax0[1].bar_label(bars, fmt='%.3f')
+
+    bars = ax1[1].bar(
+        xticks_positive,
+        [sum_total_positive/sum_total_positive] + (total_positive/sum_total_positive).tolist(),
+        color = "black",
+    )
+    ax1[1].set_title("positive")
+    ax1[1].bar_label(bars, fmt='%.3f')
+
+    fig0.text(x=0.02, y=0.5, s="Time [h]", rotation="vertical")
+    fig0.text(x=0.5, y=0.02, s="Angular momentum")
+    fig1.text(x=0.02, y=0.5, s="Norm. time", rotation="vertical")
+    fig1.text(x=0.5, y=0.02, s="Angular momentum")
+    plt.show()
 
 def _get_data_general(
     path: str,
@@ -2064,119 +2542,28 @@ def _get_data_general(
 
     func : Callable
         _get_timing_data or _get_memory_usage.
+
+    plot : bool
+        Bar plot the values of each log file in a directory. If False,
+        the values are only summed and no plot data is made.
+
+    Returns
+    -------
+    : float
+        The value for a single log file, or the sum of the values of
+        all the log files in a directory.
     """
-    total_negative = []
-    total_positive = []
-    filenames_negative = []
-    filenames_positive = []
     if os.path.isfile(path):
         return func(path)
     
     elif os.path.isdir(path):
-        for elem in os.listdir(path):
-            """
-            Select only log files in path.
-            """
-            tmp = elem.split("_")
-            try:
-                if ((tmp[0] == "log") or (tmp[1] == "log")) and elem.endswith(".txt"):
-                    tmp = tmp[-1].split(".")
-                    parity = tmp[0][-1]
-                    if parity == "n":
-                        filenames_negative.append(elem)
-                    elif parity == "p":
-                        filenames_positive.append(elem)
-            except IndexError:
-                continue
-        
-        filenames_negative.sort(key=_sortkey)
-        filenames_positive.sort(key=_sortkey)
-
-        for elem in filenames_negative:
-            total_negative.append(func(f"{path}/{elem}"))
-        for elem in filenames_positive:
-            total_positive.append(func(f"{path}/{elem}"))
+        total_negative, total_positive, filenames_negative, filenames_positive = \
+            _collect_totals(path, func)
         
         if plot:
-            xticks_negative = ["sum"] + [str(Fraction(_sortkey(i)/2)) for i in filenames_negative]
-            xticks_positive = ["sum"] + [str(Fraction(_sortkey(i)/2)) for i in filenames_positive]
-            sum_total_negative = sum(total_negative)
-            sum_total_positive = sum(total_positive)
-            
-            fig0, ax0 = plt.subplots(ncols=1, nrows=2)
-            fig1, ax1 = plt.subplots(ncols=1, nrows=2)
+            _plot_totals(total_negative, total_positive, filenames_negative, filenames_positive)
 
-            bars = ax0[0].bar(
-                xticks_negative,
-                [sum_total_negative/60/60] + [i/60/60 for i in total_negative],
-                color = "black",
-            )
-            ax0[0].set_title("negative")
-            for rect in bars:
-                height = rect.get_height()
-                ax0[0].text(
-                    x = rect.get_x() + rect.get_width() / 2.0,
-                    y = height,
-                    s = f'{height:.3f}',
-                    ha = 'center',
-                    va = 'bottom'
-                )
-            
-            bars = ax1[0].bar(
-                xticks_negative,
-                [sum_total_negative/sum_total_negative] + [i/sum_total_negative for i in total_negative],
-                color = "black",
-            )
-            ax1[0].set_title("negative")
-            for rect in bars:
-                height = rect.get_height()
-                ax1[0].text(
-                    x = rect.get_x() + rect.get_width() / 2.0,
-                    y = height,
-                    s = f'{height:.3f}',
-                    ha = 'center',
-                    va = 'bottom'
-                )
-            
-            bars = ax0[1].bar(
-                xticks_positive,
-                [sum_total_positive/60/60] + [i/60/60 for i in total_positive],
-                color = "black",
-            )
-            ax0[1].set_title("positive")
-            for rect in bars:
-                height = rect.get_height()
-                ax0[1].text(
-                    x = rect.get_x() + rect.get_width() / 2.0,
-                    y = height,
-                    s = f'{height:.3f}',
-                    ha = 'center',
-                    va = 'bottom'
-                )
-
-            bars = ax1[1].bar(
-                xticks_positive,
-                [sum_total_positive/sum_total_positive] + [i/sum_total_positive for i in total_positive],
-                color = "black",
-            )
-            ax1[1].set_title("positive")
-            for rect in bars:
-                height = rect.get_height()
-                ax1[1].text(
-                    x = rect.get_x() + rect.get_width() / 2.0,
-                    y = height,
-                    s = f'{height:.3f}',
-                    ha = 'center',
-                    va = 'bottom'
-                )
-
-            fig0.text(x=0.02, y=0.5, s="Time [h]", rotation="vertical")
-            fig0.text(x=0.5, y=0.02, s="Angular momentum")
-            fig1.text(x=0.02, y=0.5, s="Norm. time", rotation="vertical")
-            fig1.text(x=0.5, y=0.02, s="Angular momentum")
-            plt.show()
-
-        return sum(total_negative) + sum(total_positive)
+        return float(total_negative.sum() + total_positive.sum())
 
     else:
         msg = f"'{path}' is neither a file nor a directory!"
@@ -2237,10 +2624,11 @@ def get_parameters(path: str, verbose: bool = True) -> dict:
     res = {}
     shell_filename = None
     if os.path.isdir(path):
-        for elem in os.listdir(path):
-            if elem.endswith(".sh"):
-                shell_filename = f"{path}/{elem}"
-                break
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".sh") and entry.is_file():
+                    shell_filename = entry.path
+                    break
     else:
         print("Directly specifying path to .sh file not yet implemented!")
 
@@ -2252,36 +2640,38 @@ def get_parameters(path: str, verbose: bool = True) -> dict:
         return res
     
     with open(shell_filename, "r") as infile:
-        for line in infile:
-            if line.startswith(r"&input"):
-                break
-        
-        for line in infile:
-            if line.startswith(r"&end"):
-                """
-                End of parameters.
-                """
-                break
-            
-            tmp = line.split("=")
-            key = tmp[0].strip()
-            value = tmp[1].strip()
+        namelist = _namelist_pattern.search(infile.read())
 
+    if namelist is None: return res
+
+    for key, value in _namelist_item_pattern.findall(namelist.group(1)):
+        """
+        One 'key = value' pair per line, up to the line starting with
+        '&end'.
+        """
+        key = key.strip()
+        value = value.strip()
+
+        if value.lower() in (".true.", ".false."):
+            """
+            Fortran booleans.
+            """
+            value = value.lower() == ".true."
+        
+        elif value and (value[0] in "-+.0123456789'\"(["):
+            """
+            Numbers, quoted strings and lists of those. Anything
+            else is kept as a string without trying to evaluate it.
+            """
             try:
                 value = ast.literal_eval(value)
-            except ValueError:
+            except (ValueError, SyntaxError):
                 """
-                Cant convert strings. Keep them as strings.
+                Like Fortran doubles (1.d0). Keep them as strings.
                 """
                 pass
-            except SyntaxError:
-                """
-                Cant convert Fortran booleans (.true., .false.). Keep
-                them as strings.
-                """
-                pass
-            
-            res[key] = value
+        
+        res[key] = value
 
     return res
 
@@ -2302,7 +2692,8 @@ def inspect_log(
         List all log files in 'path' and let the user decide which one
         to inspect.
         """
-        content = [i for i in os.listdir(path) if "log_" in i]
+        with os.scandir(path) as entries:
+            content = [entry.name for entry in entries if ("log_" in entry.name) and entry.is_file()]
         content.sort()
         content = np.array(content)
         
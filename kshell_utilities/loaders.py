@@ -1,25 +1,135 @@
-import time, sys
+import time, sys, re, io
 from fractions import Fraction
-from typing import TextIO
+from typing import TextIO, Union
 import numpy as np
 from .kshell_exceptions import KshellDataStructureError
 from .parameters import flags
+try:
+    import pandas as pd
+except ModuleNotFoundError:
+    """
+    pandas is optional. Without it, the summary file sections are
+    parsed with np.loadtxt.
+    """
+    pd = None
+
+_old_transition_pattern = re.compile(   # One transition line of the old summary syntax.
+    r"^[ \t]*(\S+?)([+-])\([ \t]*(\d+)\)[ \t]+(\S+)"    # J_i pi_i (idx_i) Ex_i.
+    r"[ \t]+(\S+?)([+-])\([ \t]*(\d+)\)[ \t]+(\S+)"     # J_f pi_f (idx_f) Ex_f.
+    r"[ \t]+(\S+)"                                      # dE.
+    r"[ \t]+([^\s(]+)\([^)\n]*\)"                       # B(..)-> (error).
+    r"[ \t]+([^\s(]+)\([^)\n]*\)[ \t\r]*$",             # B(..)<- (error).
+    flags = re.MULTILINE
+)
+
+def _parity_strings_to_float(parities: np.ndarray) -> np.ndarray:
+    """
+    Convert a column of '+' and '-' parity strings to 1 and -1 in a
+    single vectorized comparison.
+    """
+    is_positive = parities == "+"
+    is_invalid = ~is_positive & (parities != "-")
+    if is_invalid.any():
+        msg = f"Invalid parity read from file. Got: '{parities[is_invalid][0]}'."
+        raise KshellDataStructureError(msg)
 
-def _parity_string_to_integer(parity: str):
-    if parity == "+":
-        res = 1
-    elif parity == "-":
-        res = -1
-    else:
-        msg = f"Invalid parity read from file. Got: '{parity}'."
+    return np.where(is_positive, 1., -1.)
+
+def _spin_strings_to_float(spins: np.ndarray) -> np.ndarray:
+    """
+    Convert a column of spin strings like '5/2', '2.0' or '3' from the
+    summary file to 2*spin. There are only a few unique spins in a
+    section, so only the unique strings are converted in Python.
+    """
+    spin_strings, spin_inverse = np.unique(spins, return_inverse=True)
+    unique_spins = np.array([2*float(Fraction(spin)) for spin in spin_strings])
+    
+    return unique_spins[spin_inverse.reshape(spins.shape)]
+
+def _idx_strings_to_float(idx: np.ndarray) -> np.ndarray:
+    """
+    Convert a column of JEM syntax idx strings like '1)' to floats.
+    """
+    return np.char.rstrip(idx, ")").astype(np.float64)
+
+def _read_section_lines(infile: TextIO) -> list[str]:
+    """
+    Read the table lines of a summary file section, from the current
+    position of 'infile' until the first blank line.
+    """
+    lines = []
+    for line in infile:
+        if not line.strip(): break
+        lines.append(line)
+
+    return lines
+
+def _section_lines_to_array(
+    lines: list[str],
+    usecols: tuple,
+    converters: dict
+    ) -> np.ndarray:
+    """
+    Parse all the table lines of a summary file section in a single
+    call. Uses the C parser of pandas.read_csv if pandas is installed,
+    and np.loadtxt if not.
+
+    Parameters
+    ----------
+    lines : list[str]
+        The table lines.
+
+    usecols : tuple
+        Which columns to read, in the order of the output columns.
+
+    converters : dict
+        Converters for the non-numeric columns. Each converter gets the
+        entire column as an array of strings and returns an array of
+        floats.
+
+    Raises
+    ------
+    KshellDataStructureError
+        If any of the values cannot be converted.
+    """
+    try:
+        if pd is None:
+            raw = np.loadtxt(lines, dtype=str, usecols=usecols, ndmin=2)
+            columns = {col: raw[:, i] for i, col in enumerate(usecols)}
+        else:
+            table = pd.read_csv(
+                io.StringIO("".join(lines)),
+                sep = r"\s+",
+                header = None,
+                usecols = usecols,
+                dtype = {col: str for col in converters},
+                engine = "c",
+            )
+            columns = {col: table[col].to_numpy() for col in usecols}
+
+        res = np.empty((len(columns[usecols[0]]), len(usecols)), dtype=np.float64, order="F")   # Column-major, see ReadKshellOutput._read_summary.
+        for i, col in enumerate(usecols):
+            if col in converters:
+                res[:, i] = converters[col](columns[col].astype(str))
+            else:
+                res[:, i] = columns[col]    # Parses the strings of the np.loadtxt fallback.
+    
+    except ValueError as err:
+        """
+        One of the conversions failed indicating that the structure of
+        the section is not accounted for.
+        """
+        msg = "\n" + err.__str__()
+        if err.__cause__ is not None:
+            msg += "\n" + err.__cause__.__str__()
         raise KshellDataStructureError(msg)
 
     return res
 
-def _load_energy_levels(infile: TextIO) -> tuple[list, int]:
+def _load_energy_levels(infile: TextIO) -> tuple[np.ndarray, int]:
     """
-    Load excitation energy, spin and parity into a list of structure:
-    levels = [[energy, spin, parity], ...].
+    Load excitation energy, spin and parity into an array of structure:
+    levels = [[energy, spin, parity, idx], ...].
     
     Parameters
     ----------
@@ -29,8 +139,8 @@ def _load_energy_levels(infile: TextIO) -> tuple[list, int]:
 
     Returns
     -------
-    levels : list
-        List of level data.
+    levels : np.ndarray
+        Array of level data. An empty list if there are no levels.
         
     negative_spin_counts : int
         The number of negative spin levels encountered.
@@ -48,37 +158,34 @@ def _load_energy_levels(infile: TextIO) -> tuple[list, int]:
     5   7/2 +     1   3/2    -13.267    3.298  log_O19_sdpf-mu_m1p.txt 
     6   5/2 +     2   3/2    -13.074    3.491  log_O19_sdpf-mu_m1p.txt
     """
-    levels = []
-    negative_spin_counts = 0
     for _ in range(3): infile.readline()
-    for line in infile:
-        try:
-            tmp = line.split()
-            
-            if tmp[1] == "-1":
-                """
-                -1 spin states in the KSHELL data file indicates
-                bad states which should not be included.
-                """
-                negative_spin_counts += 1  # Debug.
-                continue
-            
-            parity = 1 if tmp[2] == "+" else -1
-            energy = float(tmp[5])
-            spin = 2*float(Fraction(tmp[1]))
-            idx = int(tmp[3])
-            levels.append([energy, spin, parity, idx])
-        except IndexError:
-            """
-            End of energies.
-            """
-            break
+    lines = _read_section_lines(infile)   # Energies end at the first blank line.
+    if not lines: return [], 0
+    
+    levels = _section_lines_to_array(
+        lines = lines,
+        usecols = (5, 1, 2, 3),
+        converters = {
+            1: _spin_strings_to_float,
+            2: _parity_strings_to_float,
+        }
+    )
+    is_negative_spin = levels[:, 1] == -2
+    """
+    -1 spin states in the KSHELL data file indicates bad states which
+    should not be included.
+    """
+    negative_spin_counts = int(np.count_nonzero(is_negative_spin))  # Debug.
+    if negative_spin_counts: levels = levels[~is_negative_spin]  # Copy only if needed.
 
     return levels, negative_spin_counts
 
-def _load_transition_probabilities_old(infile: TextIO) -> tuple[list, int]:
+def _load_transition_probabilities_old(infile: TextIO) -> tuple[np.ndarray, int]:
     """
-    For summary files with old syntax (pre 2021-11-24).
+    For summary files with old syntax (pre 2021-11-24). The 'J+(idx)'
+    tokens of this syntax can't be read as plain columns, so instead
+    all the lines of the section are decoded by a single regex pass
+    and the fields are converted column by column.
 
     Parameters
     ----------
@@ -88,180 +195,74 @@ def _load_transition_probabilities_old(infile: TextIO) -> tuple[list, int]:
 
     Returns
     -------
-    transitions : list
-        List of transition data.
+    transitions : np.ndarray
+        Array of transition data. An empty list if there are no
+        transitions.
         
     negative_spin_counts : int
         The number of negative spin levels encountered.
+
+    Example
+    -------
+    J_i    Ex_i     J_f    Ex_f   dE        B(M1)->         B(M1)<- 
+    2+(11) 18.393 2+(10) 17.791 0.602 0.1(  0.0) 0.1( 0.0)
+    3/2+( 1) 0.072 5/2+( 1) 0.000 0.071 0.127( 0.07) 0.084( 0.05)
+    2+(10) 17.791 2+( 1) 5.172 12.619 0.006( 0.00) 0.006( 0.00)
+    3+( 8) 19.503 2+(11) 18.393 1.111 0.000( 0.00) 0.000( 0.00)
+    1+( 7) 19.408 2+( 9) 16.111 3.297 0.005( 0.00) 0.003( 0.00)
+    5.0+(60) 32.170  4.0+(100) 31.734  0.436    0.198( 0.11)    0.242( 0.14)
+    4.0-( 3)  3.191  3.0+(10)  3.137  0.054      0.0(  0.0)      0.0(  0.0)
+    0.0+(46) 47.248  1.0+(97) 45.384  1.864   23.973(13.39)    7.991( 4.46)
     """
-    negative_spin_counts = 0
-    transitions = []
     for _ in range(2): infile.readline()
-    for line in infile:
-        try:
-            """
-            Example of possible lines in file:
-            J_i    Ex_i     J_f    Ex_f   dE        B(M1)->         B(M1)<- 
-            2+(11) 18.393 2+(10) 17.791 0.602 0.1(  0.0) 0.1( 0.0)
-            3/2+( 1) 0.072 5/2+( 1) 0.000 0.071 0.127( 0.07) 0.084( 0.05)
-            2+(10) 17.791 2+( 1) 5.172 12.619 0.006( 0.00) 0.006( 0.00)
-            3+( 8) 19.503 2+(11) 18.393 1.111 0.000( 0.00) 0.000( 0.00)
-            1+( 7) 19.408 2+( 9) 16.111 3.297 0.005( 0.00) 0.003( 0.00)
-            5.0+(60) 32.170  4.0+(100) 31.734  0.436    0.198( 0.11)    0.242( 0.14)
-            4.0-( 3)  3.191  3.0+(10)  3.137  0.054      0.0(  0.0)      0.0(  0.0)
-            0.0+(46)', '47.248', '1.0+(97)', '45.384', '1.864', '23.973(13.39)', '7.991(', '4.46)
-            """
-            tmp = line.split()
-            len_tmp = len(tmp)
-            case_ = None # Used for identifying which if-else case reads wrong.
-            
-            # Location of initial parity is common for all cases.
-            parity_idx = tmp[0].index("(") - 1 # Find index of initial parity.
-            parity_initial = 1 if tmp[0][parity_idx] == "+" else -1
-            parity_initial_symbol = tmp[0][parity_idx]
-            
-            # Location of initial spin is common for all cases.
-            spin_initial = float(Fraction(tmp[0][:parity_idx]))
-            
-            if (tmp[1][-1] != ")") and (tmp[3][-1] != ")") and (len_tmp == 9):
-                """
-                Example:
-                J_i    Ex_i     J_f    Ex_f   dE        B(M1)->         B(M1)<- 
-                2+(11)   18.393  2+(10)    17.791  0.602    0.1(    0.0)    0.1(    0.0)
-                5.0+(60) 32.170  4.0+(100) 31.734  0.436    0.198( 0.11)    0.242( 0.14)
-                """
-                case_ = 0
-                E_gamma = float(tmp[4])
-                Ex_initial = float(tmp[1])
-                reduced_transition_prob_decay = float(tmp[5][:-1])
-                reduced_transition_prob_excite = float(tmp[7][:-1])
-                parity_final_symbol = tmp[2].split("(")[0][-1]
-                spin_final = float(Fraction(tmp[2].split(parity_final_symbol)[0]))
-                Ex_final = float(tmp[3])
-                idx_initial = int(tmp[0].split("(")[1].split(")")[0])
-                idx_final = int(tmp[2].split("(")[1].split(")")[0])
-
-            elif (tmp[1][-1] != ")") and (tmp[3][-1] == ")") and (len_tmp == 10):
-                """
-                Example:
-                J_i    Ex_i     J_f    Ex_f   dE        B(M1)->         B(M1)<- 
-                2+(10) 17.791 2+( 1) 5.172 12.619 0.006( 0.00) 0.006( 0.00)
-                """
-                case_ = 1
-                E_gamma = float(tmp[5])
-                Ex_initial = float(tmp[1])
-                reduced_transition_prob_decay = float(tmp[6][:-1])
-                reduced_transition_prob_excite = float(tmp[8][:-1])
-                parity_final_symbol = tmp[2].split("(")[0][-1]
-                # spin_final = float(Fraction(tmp[2][:-2]))
-                spin_final = float(Fraction(tmp[2].split(parity_final_symbol)[0]))
-                Ex_final = float(tmp[4])
-                idx_initial = int(tmp[0].split("(")[1].split(")")[0])
-                idx_final = int(tmp[3][0])
-            
-            elif (tmp[1][-1] == ")") and (tmp[4][-1] != ")") and (len_tmp == 10):
-                """
-                Example:
-                J_i    Ex_i     J_f    Ex_f   dE        B(M1)->         B(M1)<- 
-                3+( 8)   19.503 2+(11)    18.393 1.111 0.000( 0.00) 0.000( 0.00)
-                1.0+( 1) 5.357  0.0+(103) 0.000  5.357 0.002( 0.00) 0.007( 0.00)
-                4.0-( 3)  3.191  3.0+(10)  3.137  0.054      0.0(  0.0)      0.0(  0.0)
-                """
-                case_ = 2
-                E_gamma = float(tmp[5])
-                Ex_initial = float(tmp[2])
-                reduced_transition_prob_decay = float(tmp[6][:-1])
-                reduced_transition_prob_excite = float(tmp[8][:-1])
-                parity_final_symbol = tmp[3].split("(")[0][-1]
-                spin_final = float(Fraction(tmp[3].split(parity_final_symbol)[0]))
-                Ex_final = float(tmp[4])
-                idx_initial = int(tmp[1][0])
-                idx_final = int(tmp[3].split("(")[1].split(")")[0])
-
-            elif (tmp[1][-1] == ")") and (tmp[4][-1] == ")") and (len_tmp == 11):
-                """
-                Example:
-                J_i    Ex_i     J_f    Ex_f   dE        B(M1)->         B(M1)<- 
-                1+( 7) 19.408 2+( 9) 16.111 3.297 0.005( 0.00) 0.003( 0.00)
-                """
-                case_ = 3
-                E_gamma = float(tmp[6])
-                Ex_initial = float(tmp[2])
-                reduced_transition_prob_decay = float(tmp[7][:-1])
-                reduced_transition_prob_excite = float(tmp[9][:-1])
-                parity_final_symbol = tmp[3].split("(")[0][-1]
-                # spin_final = float(Fraction(tmp[3][:-2]))
-                spin_final = float(Fraction(tmp[3].split(parity_final_symbol)[0]))
-                Ex_final = float(tmp[5])
-                idx_initial = int(tmp[1][0])
-                idx_final = int(tmp[4][0])
-
-            elif (tmp[5][-1] == ")") and (tmp[2][-1] == ")") and (len_tmp == 8):
-                """
-                Example:
-                J_i    Ex_i     J_f    Ex_f   dE        B(M1)->         B(M1)<- 
-                0.0+(46) 47.248  1.0+(97) 45.384  1.864   23.973(13.39)    7.991( 4.46)
-                """
-                case_ = 4
-                E_gamma = float(tmp[4])
-                Ex_initial = float(tmp[1])
-                reduced_transition_prob_decay = float(tmp[5].split("(")[0])
-                reduced_transition_prob_excite = float(tmp[6][:-1])
-                parity_final_symbol = tmp[2].split("(")[0][-1]
-                spin_final = float(Fraction(tmp[2].split(parity_final_symbol)[0]))
-                Ex_final = float(tmp[3])
-                idx_initial = int(tmp[0].split("(")[1].split(")")[0])
-                idx_final = int(tmp[2].split("(")[1].split(")")[0])
-
-            else:
+    lines = _read_section_lines(infile)
+    if not lines: return [], 0
+
+    rows = _old_transition_pattern.findall("".join(lines))
+    if len(rows) != len(lines):
+        """
+        At least one line did not match. Find the first one for the
+        error message.
+        """
+        for line in lines:
+            if _old_transition_pattern.match(line) is None:
                 msg = "ERROR: Structure not accounted for!"
                 msg += f"\n{line=}"
                 raise KshellDataStructureError(msg)
 
-            if parity_final_symbol == "+":
-                parity_final = 1
-            elif parity_final_symbol == "-":
-                parity_final = -1
-            else:
-                msg = f"Could not properly read the final parity! {case_=}"
-                raise KshellDataStructureError(msg)
+    raw = np.array(rows)    # Columns: J_i, pi_i, idx_i, Ex_i, J_f, pi_f, idx_f, Ex_f, dE, B->, B<-.
+    try:
+        """
+        Spins are given as fractions like '3/2' or decimals like '5.0'.
+        The regex only matches '+' and '-' parities.
+        """
+        spins = _spin_strings_to_float(raw[:, [0, 4]])
+        transitions = np.empty((len(raw), 11), dtype=np.float64, order="F")
+        transitions[:, 0] = spins[:, 0]
+        transitions[:, 1] = np.where(raw[:, 1] == "+", 1., -1.)
+        transitions[:, 2:4] = raw[:, 2:4]
+        transitions[:, 4] = spins[:, 1]
+        transitions[:, 5] = np.where(raw[:, 5] == "+", 1., -1.)
+        transitions[:, 6:11] = raw[:, 6:11]
+    except ValueError as err:
+        """
+        One of the float conversions failed indicating that the
+        structure of the section is not accounted for.
+        """
+        msg = "\n" + err.__str__()
+        raise KshellDataStructureError(msg)
 
-            if (spin_final == -1) or (spin_initial == -1):
-                """
-                -1 spin states in the KSHELL data file indicates
-                bad states which should not be included.
-                """
-                negative_spin_counts += 1  # Debug.
-                continue
-
-            # reduced_transition_prob_decay_list.append([
-            #     2*spin_initial, parity_initial, Ex_initial, 2*spin_final,
-            #     parity_final, Ex_final, E_gamma, reduced_transition_prob_decay,
-            #     reduced_transition_prob_excite
-            # ])
-            transitions.append([
-                2*spin_initial, parity_initial, idx_initial, Ex_initial,
-                2*spin_final, parity_final, idx_final, Ex_final, E_gamma,
-                reduced_transition_prob_decay, reduced_transition_prob_excite
-            ])
-
-        except ValueError as err:
-            """
-            One of the float conversions failed indicating that
-            the structure of the line is not accounted for.
-            """
-            msg = "\n" + err.__str__() + f"\n{case_=}" + f"\n{line=}"
-            raise KshellDataStructureError(msg)
-
-        except IndexError:
-            """
-            End of probabilities.
-            """
-            break
+    is_negative_spin = (transitions[:, 0] == -2) | (transitions[:, 4] == -2)
+    """
+    -1 spin states in the KSHELL data file indicates bad states which
+    should not be included.
+    """
+    negative_spin_counts = int(np.count_nonzero(is_negative_spin))  # Debug.
+    if negative_spin_counts: transitions = transitions[~is_negative_spin]  # Copy only if needed.
 
     return transitions, negative_spin_counts
     
-def _load_transition_probabilities(infile: TextIO) -> tuple[list, int]:
+def _load_transition_probabilities(infile: TextIO) -> tuple[np.ndarray, int]:
     """
     For summary files with new syntax (post 2021-11-24).
 
@@ -273,8 +274,9 @@ def _load_transition_probabilities(infile: TextIO) -> tuple[list, int]:
 
     Returns
     -------
-    transitions : list
-        List of transition data.
+    transitions : np.ndarray
+        Array of transition data. An empty list if there are no
+        transitions.
 
     negative_spin_counts : int
         The number of negative spin levels encountered.
@@ -287,79 +289,102 @@ def _load_transition_probabilities(infile: TextIO) -> tuple[list, int]:
     5    +    1     0.036   6    +    1     0.000     0.036     70.43477980      6.43689168     59.59865983      5.44660066
     4    +    1     0.074   6    +    1     0.000     0.074     47.20641983      4.31409897     32.68136758      2.98668391
     """
-    negative_spin_counts = 0
-    transitions = []
     for _ in range(2): infile.readline()
-    for line in infile:
-        line_split = line.split()
-        if not line_split: break
-        
-        spin_initial = float(Fraction(line_split[0]))
-        parity_initial = _parity_string_to_integer(line_split[1])
-        idx_initial = int(line_split[2])
-        Ex_initial = float(line_split[3])
-
-        spin_final = float(Fraction(line_split[4]))
-        parity_final = _parity_string_to_integer(line_split[5])
-        idx_final = int(line_split[2])
-        Ex_final = float(line_split[7])
-
-        E_gamma = float(line_split[8])
-        reduced_transition_prob_decay = float(line_split[9])
-        reduced_transition_prob_excite = float(line_split[11])
-
-        if (spin_final < 0) or (spin_initial < 0):
-            """
-            -1 spin states in the KSHELL data file indicates
-            bad states which should not be included.
-            """
-            negative_spin_counts += 1  # Debug.
-            continue
-
-        # reduced_transition_prob_decay_list.append([
-        #     2*spin_initial, parity_initial, Ex_initial, 2*spin_final,
-        #     parity_final, Ex_final, E_gamma, reduced_transition_prob_decay,
-        #     reduced_transition_prob_excite
-        # ])
-        transitions.append([
-            2*spin_initial, parity_initial, idx_initial, Ex_initial,
-            2*spin_final, parity_final, idx_final, Ex_final, E_gamma,
-            reduced_transition_prob_decay, reduced_transition_prob_excite
-        ])
+    lines = _read_section_lines(infile)
+    if not lines: return [], 0
+
+    transitions = _section_lines_to_array(
+        lines = lines,
+        usecols = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 11),
+        converters = {
+            0: _spin_strings_to_float,
+            1: _parity_strings_to_float,
+            4: _spin_strings_to_float,
+            5: _parity_strings_to_float,
+        }
+    )
+    is_negative_spin = (transitions[:, 0] < 0) | (transitions[:, 4] < 0)
+    """
+    -1 spin states in the KSHELL data file indicates bad states which
+    should not be included.
+    """
+    negative_spin_counts = int(np.count_nonzero(is_negative_spin))  # Debug.
+    if negative_spin_counts: transitions = transitions[~is_negative_spin]  # Copy only if needed.
 
     return transitions, negative_spin_counts
 
-def _generic_loader(arg_list: list) -> tuple[list, int]:
+def _find_summary_sections(fname: str, conditions: list[str]) -> dict[str, int]:
+    """
+    Find the positions of the summary file sections in a single pass
+    over the file, so that each loader can go directly to its section.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the summary file.
+
+    conditions : list[str]
+        Strings which identify the section header lines, like 'Energy'
+        and 'B(E1)'.
+
+    Returns
+    -------
+    offsets : dict[str, int]
+        {condition: byte offset, ...} where the byte offset is the start
+        of the line following the first line containing 'condition'.
+        Conditions which are not found in the file are not included.
+    """
+    offsets = {}
+    remaining = {condition: condition.encode() for condition in conditions}
+    offset = 0
+    with open(fname, "rb") as infile:
+        for line in infile:
+            offset += len(line)
+            for condition, condition_bytes in list(remaining.items()):
+                if condition_bytes in line:
+                    offsets[condition] = offset
+                    del remaining[condition]
+            
+            if not remaining: break
+
+    return offsets
+
+def _generic_loader(arg_list: list, parallel: Union[bool, None] = None) -> tuple[list, int]:
     """
     Constructed for parallel loading, but can be used in serial as well.
+    arg_list is [fname, condition, loader, thread_idx, offset] where
+    offset is the position of the section in the file, as given by
+    _find_summary_sections, or None if the section is not in the file.
+    'parallel' only selects the progress message. flags["parallel"] is
+    used if it is None.
     """
-    fname, condition, loader, thread_idx = arg_list
+    fname, condition, loader, thread_idx, offset = arg_list
+    if parallel is None: parallel = flags["parallel"]
     
-    if flags["parallel"]:
+    if parallel:
         print(f"Thread {thread_idx} loading {condition} values...")
     else:
         print(f"Loading {condition} values...")
         
     load_time = time.perf_counter()
     
-    with open(fname, "r") as infile:
-        for line in infile:
-            if condition in line:
-                ans = loader(infile)
-                break
-        else:
-            ans = [], 0
+    if offset is None:
+        ans = [], 0
+    else:
+        with open(fname, "r") as infile:
+            infile.seek(offset)
+            ans = loader(infile)
     
     load_time = time.perf_counter() - load_time
     
-    if not ans[0]:
+    if len(ans[0]) == 0:
         print(f"No {condition} transitions found in {fname}")
     else:
         print(f"Thread {thread_idx} finished loading {condition} values in {load_time:.2f} s")
 
     return ans
 
-def _load_transition_probabilities_jem(infile: TextIO) -> tuple[list, int]:
+def _load_transition_probabilities_jem(infile: TextIO) -> tuple[np.ndarray, int]:
     """
     JEM has modified the summary files from KSHELL with a slightly
     different syntax. This function reads that syntax. Note also that
@@ -373,8 +398,9 @@ def _load_transition_probabilities_jem(infile: TextIO) -> tuple[list, int]:
 
     Returns
     -------
-    transitions : list
-        List of transition data.
+    transitions : np.ndarray
+        Array of transition data. An empty list if there are no
+        transitions.
 
     negative_spin_counts : int
         The number of negative spin levels encountered.
@@ -387,38 +413,26 @@ def _load_transition_probabilities_jem(infile: TextIO) -> tuple[list, int]:
     0 - (   8) -35.583   2 - (   2) -35.350   0.233      0.45171030      0.15057010
     0 - (   8) -35.583   2 - (   3) -34.736   0.847      0.04406500      0.01468830
     """
-    negative_spin_counts = 0
-    transitions = []
-
     infile.readline()   # Skip header line.
-    for line in infile:
-        line_split = line.split()
-        if not line_split: break
-
-        spin_initial = int(line_split[0])
-        parity_initial = _parity_string_to_integer(line_split[1])
-        idx_initial = int(line_split[3].strip(")"))
-        Ex_initial = float(line_split[4])
-        spin_final = int(line_split[5])
-        parity_final = _parity_string_to_integer(line_split[6])
-        idx_final = int(line_split[8].strip(")"))
-        Ex_final = float(line_split[9])
-        E_gamma = float(line_split[10])
-        reduced_transition_prob_decay = float(line_split[11])
-        reduced_transition_prob_excite = float(line_split[12])
-
-        if (spin_final < 0) or (spin_initial < 0):
-            """
-            -1 spin states in the KSHELL data file indicates
-            bad states which should not be included.
-            """
-            negative_spin_counts += 1  # Debug.
-            continue
-
-        transitions.append([
-            spin_initial, parity_initial, idx_initial, Ex_initial,
-            spin_final, parity_final, idx_final, Ex_final, E_gamma,
-            reduced_transition_prob_decay, reduced_transition_prob_excite
-        ])
+    lines = _read_section_lines(infile)
+    if not lines: return [], 0
+
+    transitions = _section_lines_to_array(
+        lines = lines,
+        usecols = (0, 1, 3, 4, 5, 6, 8, 9, 10, 11, 12),
+        converters = {
+            1: _parity_strings_to_float,
+            3: _idx_strings_to_float,
+            6: _parity_strings_to_float,
+            8: _idx_strings_to_float,
+        }
+    )
+    is_negative_spin = (transitions[:, 0] < 0) | (transitions[:, 4] < 0)
+    """
+    -1 spin states in the KSHELL data file indicates bad states which
+    should not be included.
+    """
+    negative_spin_counts = int(np.count_nonzero(is_negative_spin))  # Debug.
+    if negative_spin_counts: transitions = transitions[~is_negative_spin]  # Copy only if needed.
     
-    return transitions, negative_spin_counts
\ No newline at end of file
+    return transitions, negative_spin_counts
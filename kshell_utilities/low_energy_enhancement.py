@@ -1,8 +1,23 @@
 import os
+from operator import itemgetter
+from functools import partial
+from typing import Union
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 from .kshell_utilities import atomic_numbers, loadtxt
 from .general_utilities import create_spin_parity_list, gamma_strength_function_average
+from .collect_logs import _reader_executor
+
+def _loadtxt_or_none(path: str, parallel: Union[bool, None] = None):
+    """
+    loadtxt, but None if the file is not found, so that a missing file
+    does not stop the loading of the others.
+    """
+    try:
+        return loadtxt(path, parallel=parallel)
+    except FileNotFoundError:
+        return None
 
 class LEE:
     def __init__(self, directory):
@@ -19,19 +34,21 @@ class LEE:
 
         self.directory = directory
 
-        for element in sorted(os.listdir(self.directory)):
+        with os.scandir(self.directory) as entries:
+            element_directories = sorted((entry.name, entry.path) for entry in entries if entry.is_dir())
+
+        for element, element_path in element_directories:
             """
-            List all content in self.directory.
+            Loop over all directories in self.directory, and enter them
+            to find data files.
             """
-            if os.path.isdir(f"{self.directory}/{element}"):
-                """
-                If element is a directory, enter it to find data files.
-                """
-                self.all_fnames[element] = []    # Create blank entry in dict for current element.
-                for isotope in os.listdir(f"{self.directory}/{element}"):
+            self.all_fnames[element] = []    # Create blank entry in dict for current element.
+            with os.scandir(element_path) as isotope_entries:
+                for isotope_entry in isotope_entries:
                     """
                     List all content in the element directory.
                     """
+                    isotope = isotope_entry.name
                     if isotope.startswith("summary"):
                         """
                         Extract summary data files.
@@ -50,12 +67,8 @@ class LEE:
                         n_neutrons -= atomic_numbers[element.split("_")[1]]
                         
                         self.all_fnames[element].append([f"{element}/{isotope}", n_neutrons])
-        
-        for key in self.all_fnames:
-            """
-            Sort each list in the dict by the number of neutrons.
-            """
-            self.all_fnames[key].sort(key=lambda tup: tup[1])   # Why not do this when directory is listed?
+
+            self.all_fnames[element].sort(key=itemgetter(1))    # Sort by the number of neutrons.
 
     # def plot_gsf(self, isotope_name):
     #     """
@@ -107,6 +120,27 @@ class LEE:
     #     plt.show()
 
 
+    def _load_summaries(self, paths: list) -> list:
+        """
+        Load summary files in a single dispatch. When the files are
+        loaded concurrently, each of them is loaded without threads of
+        its own.
+
+        Parameters
+        ----------
+        paths : list
+            Paths to the summary files.
+
+        Returns
+        -------
+        : list
+            ReadKshellOutput instances in the order of 'paths', None
+            for files which are not found.
+        """
+        with _reader_executor(len(paths)) as executor:
+            parallel = False if isinstance(executor, ThreadPoolExecutor) else None
+            return list(executor.map(partial(_loadtxt_or_none, parallel=parallel), paths))
+
     def calculate_low_energy_enhancement(self, filter=None):
         """
         Recreate the figure from Jørgens article.
@@ -115,26 +149,30 @@ class LEE:
         self.ratios = []
         self.n_neutrons = []
 
-        for key in self.all_fnames:
+        keys = [
+            key for key in self.all_fnames
+            if (filter is None) or (key.split("_")[1] in filter)    # Skip elements not in filter.
+        ]
+        paths = [
+            f"{self.directory}/{fname}"
+            for key in keys for fname, _ in self.all_fnames[key]
+        ]
+
+        loaded = iter(self._load_summaries(paths))
+
+        for key in keys:
             """
             Loop over all elements (grunnstoff).
             """
             fnames = self.all_fnames[key]   # For compatibility with old code.
-            if filter is not None:
-                if key.split("_")[1] not in filter:
-                    """
-                    Skip elements not in filter.
-                    """
-                    continue
             
             ratios = [] # Reset ratio for every new element.
             for i in range(len(fnames)):
                 """
                 Loop over all isotopes per element.
                 """
-                try:
-                    res = loadtxt(f"{self.directory}/{fnames[i][0]}")
-                except FileNotFoundError:
+                res = next(loaded)
+                if res is None:
                     print(f"File {fnames[i][0]} skipped! File not found.")
                     ratios.append(None) # Maintain correct list length for plotting.
                     continue
@@ -151,7 +189,7 @@ class LEE:
                     print(f"File {fnames[i][0]} skipped! Too few / no energy levels are present in this data file.")
                     ratios.append(None) # Maintain correct list length for plotting.
                     continue
-                
+            
                 try:
                     gsf = strength_function_average(
                         levels = res.levels,
@@ -183,7 +221,7 @@ class LEE:
                 Skip current element if no ratios are calculated.
                 """
                 continue
-            
+        
             self.labels.append(fnames[0][0][:fnames[0][0].index("/")])
             self.n_neutrons.append([n_neutrons for _, n_neutrons in fnames])
             self.ratios.append(ratios)
@@ -1,3 +1,6 @@
+import atexit, multiprocessing
+from multiprocessing.pool import Pool
+
 GS_FREE_PROTON = 5.585
 GS_FREE_NEUTRON = -3.826
 flags = {"debug": False, "parallel": True}
@@ -8,6 +11,28 @@ def debug_mode(switch):
     else:
         print(f"Invalid debug switch '{switch}'")
 
+_pool = None
+
+def get_pool() -> Pool:
+    """
+    Return the process pool shared by all parallel operations. The pool
+    is created on the first call and closed at interpreter exit, so
+    that the worker start-up cost is paid only once per session.
+    """
+    global _pool
+    if _pool is None:
+        _pool = multiprocessing.Pool()
+        atexit.register(_close_pool)
+
+    return _pool
+
+def _close_pool():
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool.join()
+        _pool = None
+
 def latex_plot():
     import matplotlib.pyplot as plt
     plt.rcParams.update({
@@ -15,7 +15,8 @@ setup(
     author = 'Jon Kristian Dahl',
     author_email = 'jonkd@uio.no',
     packages = ['kshell_utilities', 'tests'],
-    install_requires = ['numpy', 'matplotlib', 'seaborn', 'scipy'],
+    install_requires = ['numpy', 'matplotlib>=3.4', 'seaborn', 'scipy'],
+    extras_require = {'numba': ['numba'], 'pandas': ['pandas']},
 
     classifiers = [
         'Development Status :: 5 - Production/Stable',
@@ -1,6 +1,16 @@
+import os, io, json, tempfile, shutil, importlib
 from itertools import zip_longest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from fractions import Fraction
+from types import SimpleNamespace
+from unittest.mock import patch
 import numpy as np
+import pytest
 import kshell_utilities.kshell_utilities
+from kshell_utilities.kshell_utilities import _sortkey, _generate_unique_identifier
+from kshell_utilities.low_energy_enhancement import LEE
+from kshell_utilities import loaders
 
 def test_file_read_levels():
     """
@@ -410,9 +420,553 @@ def test_file_read_transitions_jem():
         msg += f" Expected: {B_excite_expected[i]}, got {res.transitions_BM1[i, 10]}."
         assert res.transitions_BM1[i, 10] == B_excite_expected[i], msg
 
+def test_timing_data_m_scheme_logs():
+    """
+    Check that a directory of M-scheme logs, where the angular momentum
+    in the file names is prefixed by 'm' instead of 'j', is read. The
+    transit log is summed with the positive parity logs.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        with open(f"{directory}/log_Ar30_usda_m0p.txt", "w") as outfile:
+            outfile.write("\n      total      20.899         2    10.44928   1.0000\n")
+
+        with open(f"{directory}/log_Ar30_usda_m3n.txt", "w") as outfile:
+            outfile.write("\n      total       1.101         2    10.44928   1.0000\n")
+
+        with open(f"{directory}/log_Ar30_usda_tr_m0p_m0p.txt", "w") as outfile:
+            outfile.write("\n      total      20.899         2    41.79800   1.0000\n")
+
+        total = kshell_utilities.get_timing_data(directory)
+        total_expected = 20.899 + 1.101 + 41.798
+        msg = f"Error in total time. Expected: {total_expected}, got: {total}."
+        assert np.isclose(total, total_expected), msg
+
+def test_sortkey():
+    """
+    Check that the angular momentum is read from log file names, and
+    that names without it raise ValueError.
+    """
+    assert _sortkey("log_Sc44_GCLSTsdpfsdgix5pn_j0n.txt") == 0
+    assert _sortkey("log_Ar30_usda_m13p.txt") == 13
+
+    for fname in ["log_Ar30_usda_mp.txt", "log_Ar30_usda_m0x.txt", "log_Ar30_usda_00p.txt"]:
+        with pytest.raises(ValueError):
+            _sortkey(fname)
+
+def test_unique_identifier_index_concurrent():
+    """
+    Check that no entries of the unique identifier index are lost when
+    identifiers are generated in several threads at once.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        directories = []
+        for i in range(32):
+            os.makedirs(f"{directory}/{i}")
+            with open(f"{directory}/{i}/run.sh", "w") as outfile:
+                outfile.write(f"echo {i}\n")
+            
+            directories.append(f"{directory}/{i}")
+
+        index_fname = f"{directory}/unique_id_index.json"
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            unique_ids = list(executor.map(
+                lambda path: _generate_unique_identifier(path, index_fname),
+                directories
+            ))
+
+        with open(index_fname, "r") as infile:
+            index = json.load(infile)
+
+        msg = f"Error in number of index entries. Expected: {len(directories)}, got: {len(index)}."
+        assert len(index) == len(directories), msg
+        for path, unique_id in zip(directories, unique_ids):
+            assert index[os.path.abspath(path)][1] == unique_id
+
+def test_unique_identifier_relative_path():
+    """
+    Check that the same relative path in two different working
+    directories does not give the same cached unique identifier, even
+    if the names and modification times of the files are the same.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(2):
+            os.makedirs(f"{directory}/{i}/work")
+            with open(f"{directory}/{i}/work/run.sh", "w") as outfile:
+                outfile.write(f"echo {i}\n")
+            
+            os.utime(f"{directory}/{i}/work/run.sh", ns=(0, 0))
+
+        unique_ids = []
+        try:
+            for i in range(2):
+                os.chdir(f"{directory}/{i}")
+                unique_ids.append(_generate_unique_identifier("work"))
+        finally:
+            os.chdir(cwd)
+
+    assert unique_ids[0] != unique_ids[1]
+
+def test_unique_identifier_index_after_cache():
+    """
+    Check that an identifier which was cached before the directory of
+    the index existed is written to the index by a later call.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        with open(f"{directory}/run.sh", "w") as outfile:
+            outfile.write("echo index\n")
+
+        index_fname = f"{directory}/tmp/unique_id_index.json"
+        unique_id = _generate_unique_identifier(directory, index_fname)
+        assert not os.path.isfile(index_fname)
+
+        os.mkdir(f"{directory}/tmp")
+        assert _generate_unique_identifier(directory, index_fname) == unique_id
+        with open(index_fname, "r") as infile:
+            index = json.load(infile)
+
+        assert index[os.path.abspath(directory)][1] == unique_id
+
+def test_low_energy_enhancement_load_summaries():
+    """
+    Check that LEE finds and loads several summary files concurrently,
+    sorted by the number of neutrons, and that the .npy files and the
+    unique identifier index are written for all of them.
+    """
+    fixture = os.path.abspath("summary_Ni56_gxpf1a_new_syntax.txt")
+    expected = kshell_utilities.loadtxt(path=fixture, load_and_save_to_file=False)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.makedirs(f"{directory}/data/18_argon")
+        os.makedirs(f"{directory}/tmp")  # The index is only written if the directory exists.
+        with open(f"{directory}/data/18_argon/run.sh", "w") as outfile:
+            outfile.write("echo Ar\n")
+        
+        for A in [40, 36, 38]:
+            shutil.copy(fixture, f"{directory}/data/18_argon/summary_Ar{A}_gxpf1a.txt")
+
+        os.chdir(directory)  # The .npy files are saved relative to the working directory.
+        try:
+            lee = LEE("data")
+            fnames = lee.all_fnames["18_argon"]
+            n_neutrons_expected = [18, 20, 22]
+            msg = f"Error in n_neutrons. Expected: {n_neutrons_expected}, got: {[n for _, n in fnames]}."
+            assert [n for _, n in fnames] == n_neutrons_expected, msg
+
+            parallel_flags = []  # flags["parallel"] while the sections are loaded.
+            def _generic_loader(*args, **kwargs):
+                parallel_flags.append(kshell_utilities.flags["parallel"])
+                return loaders._generic_loader(*args, **kwargs)
+
+            parallel = kshell_utilities.flags["parallel"]
+            with patch("kshell_utilities.kshell_utilities._generic_loader", _generic_loader):
+                loaded = lee._load_summaries([f"data/{fname}" for fname, _ in fnames])
+            
+            msg = "The parallel flag must not be changed by LEE."
+            assert parallel_flags and all(flag == parallel for flag in parallel_flags), msg
+            assert kshell_utilities.flags["parallel"] == parallel, msg
+            for res in loaded:
+                assert res.parallel is False    # No threads within the loader threads.
+                assert np.array_equal(res.levels, expected.levels)
+                assert np.array_equal(res.transitions_BM1, expected.transitions_BM1)
+
+            with open("tmp/unique_id_index.json", "r") as infile:
+                index = json.load(infile)
+
+            assert os.path.abspath("data/18_argon") in index
+            for A in [36, 38, 40]:
+                assert os.path.isfile(f"tmp/summary_Ar{A}_gxpf1a_levels_{loaded[0].unique_id}.npy")
+        finally:
+            os.chdir(cwd)
+
+def _summary_with_negative_spin(directory: str) -> str:
+    """
+    Copy the new syntax summary fixture to 'directory', with the spin of
+    the first B(M1) transition set to -1.
+    """
+    with open("summary_Ni56_gxpf1a_new_syntax.txt", "r") as infile:
+        content = infile.read()
+
+    row = "1    +    1     0.900   0    +    1     0.000     0.900     38.45311855"
+    assert content.count(row) == 1
+    content = content.replace(row, "-1   " + row[5:])
+    fname = f"{directory}/summary_Ni56_gxpf1a.txt"
+    with open(fname, "w") as outfile:
+        outfile.write(content)
+
+    return fname
+
+def test_load_selection_debug_counts():
+    """
+    Check that loading a selection of the sections does not overwrite
+    the saved skipped -1 spin state counts of the other sections.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        fname = _summary_with_negative_spin(directory)
+        with open(f"{directory}/run.sh", "w") as outfile:
+            outfile.write("echo Ni56\n")
+        
+        os.chdir(directory)  # The .npy files are saved relative to the working directory.
+        try:
+            res = kshell_utilities.loadtxt(path=fname)
+            assert res.negative_spin_counts == [0, 0, 1, 0]
+
+            res = kshell_utilities.loadtxt(path=fname, load_and_save_to_file="overwrite", load=("BE2",))
+            assert res.negative_spin_counts == [0, 0, 0, 0]
+            assert res.transitions_BM1 is None
+
+            res = kshell_utilities.loadtxt(path=fname)    # From .npy.
+            assert res.negative_spin_counts == [0, 0, 1, 0]
+            assert "skipped -1 states in BM1: 1" in res.debug
+        finally:
+            os.chdir(cwd)
+
+def test_load_selection():
+    """
+    Check that a selection of the sections can be loaded, that 'levels'
+    is always loaded with it, and that the gsf of a loaded multipole is
+    the same as for a full load. A multipole which is not loaded must
+    raise RuntimeError.
+    """
+    fname = "summary_Ni56_gxpf1a_new_syntax.txt"
+    res_full = kshell_utilities.loadtxt(path=fname, load_and_save_to_file=False)
+    res = kshell_utilities.loadtxt(path=fname, load_and_save_to_file=False, load=("BM1",))
+
+    assert res.load == ("levels", "BM1")
+    assert res.transitions_BE1 is None
+    assert res.transitions_BE2 is None
+    assert np.array_equal(res.levels, res_full.levels)
+    assert np.array_equal(res.transitions_BM1, res_full.transitions_BM1)
+
+    for calculated, expected in zip(res.gsf(multipole_type="M1", plot=False), res_full.gsf(multipole_type="M1", plot=False)):
+        assert np.array_equal(calculated, expected)
+
+    with pytest.raises(RuntimeError):
+        res.gsf(multipole_type="E2", plot=False)
+
+    with pytest.raises(ValueError):
+        kshell_utilities.loadtxt(path=fname, load_and_save_to_file=False, load=("M1",))
+
+def _load_summary_sections(fname: str, old_or_new: str) -> SimpleNamespace:
+    """
+    Load all sections of a summary file directly with the loaders,
+    bypassing ReadKshellOutput. The returned namespace has the same
+    attribute names as ReadKshellOutput so that it can be passed to the
+    tests above.
+    """
+    transitions_loader = {
+        "new": loaders._load_transition_probabilities,
+        "old": loaders._load_transition_probabilities_old,
+        "jem": loaders._load_transition_probabilities_jem,
+    }[old_or_new]
+    conditions = ["Energy", "B(E1)", "B(M1)", "B(E2)"]
+    offsets = loaders._find_summary_sections(fname, conditions)
+    res = SimpleNamespace(negative_spin_counts=[])
+
+    for condition, attribute in zip(conditions, ["levels", "transitions_BE1", "transitions_BM1", "transitions_BE2"]):
+        loader = loaders._load_energy_levels if (condition == "Energy") else transitions_loader
+        with redirect_stdout(io.StringIO()):
+            data, negative_spin_count = loaders._generic_loader([fname, condition, loader, 0, offsets.get(condition)])
+        
+        setattr(res, attribute, data)
+        res.negative_spin_counts.append(negative_spin_count)
+
+    return res
+
+def _parse_new_syntax_summary(fname: str) -> dict:
+    """
+    Parse a new syntax summary file line by line, independently of the
+    loaders. Levels are [E, 2*J, parity, N_Jp] and transitions are
+    [2*J_i, pi_i, idx_i, Ex_i, 2*J_f, pi_f, idx_f, Ex_f, dE, B->, B<-].
+    """
+    sections = {}
+    section = None
+    with open(fname, "r") as infile:
+        for line in infile:
+            tmp = line.split()
+            if not tmp: continue
+            if tmp[0] == "Energy":
+                section = sections.setdefault("Energy", [])
+                continue
+            if tmp[0].startswith("B("):
+                section = sections.setdefault(tmp[0], [])
+                continue
+            if section is None: continue
+
+            try:
+                if tmp[0] == "N": continue
+                float(Fraction(tmp[0]))
+            except ValueError:
+                continue    # Column headers.
+
+            if len(tmp) == 8:
+                section.append([
+                    float(tmp[5]), 2*float(Fraction(tmp[1])),
+                    1 if tmp[2] == "+" else -1, float(tmp[3])
+                ])
+            else:
+                section.append([
+                    2*float(Fraction(tmp[0])), 1 if tmp[1] == "+" else -1,
+                    float(tmp[2]), float(tmp[3]),
+                    2*float(Fraction(tmp[4])), 1 if tmp[5] == "+" else -1,
+                    float(tmp[6]), float(tmp[7]), float(tmp[8]),
+                    float(tmp[9]), float(tmp[11])
+                ])
+
+    return {key: np.array(value) for key, value in sections.items()}
+
+def test_loaders_new_syntax():
+    """
+    Test the new syntax loaders against an independent parse of the
+    summary file, including the final state index idx_f of the
+    transitions.
+    """
+    fname = "summary_Ni56_gxpf1a_new_syntax.txt"
+    res = _load_summary_sections(fname, "new")
+    expected = _parse_new_syntax_summary(fname)
+
+    assert res.negative_spin_counts == [0, 0, 0, 0]
+    assert np.array_equal(res.levels, expected["Energy"])
+    for calculated, condition in zip([res.transitions_BE1, res.transitions_BM1, res.transitions_BE2], ["B(E1)", "B(M1)", "B(E2)"]):
+        msg = f"{condition}: Error in transitions."
+        assert np.array_equal(calculated, expected[condition]), msg
+
+    msg = "BE2: Error in idx_f."
+    assert np.array_equal(res.transitions_BE2[:, 6], expected["B(E2)"][:, 6]), msg
+    assert np.any(res.transitions_BE2[:, 6] != res.transitions_BE2[:, 2]), msg
+
+def test_loaders_old_syntax():
+    """
+    Run the old syntax tests above on the output of the loaders.
+    """
+    res = _load_summary_sections("summary_test_text_file.txt", "old")
+    assert res.negative_spin_counts == [1, 0, 3, 3]
+
+    with patch.object(kshell_utilities, "loadtxt", return_value=[res]):
+        test_file_read_levels()
+        test_int_vs_floor()
+        test_file_read_transitions()
+
+def test_loaders_jem_syntax():
+    """
+    The jem syntax loaders return the absolute energies and 2*J as
+    listed in the summary file.
+    """
+    res = _load_summary_sections("summary_Zn60_jun45_jem_syntax.txt", "jem")
+    E_expected = [
+        -50.42584, -49.42999, -47.78510, -46.30908, -46.24604,
+        -45.97338, -45.85816, -45.69709, -45.25258, -45.22663
+    ]
+    spin_expected = [
+        0, 4, 8, 4, 0, 4, 12, 2, 8, 6
+    ]
+
+    assert res.negative_spin_counts == [0, 0, 0, 0]
+    assert res.levels[:, 0].tolist() == E_expected
+    assert res.levels[:, 1].tolist() == [2*spin for spin in spin_expected]
+    assert np.all(res.levels[:, 2] == 1)
+
+def test_loaders_negative_spin():
+    """
+    Test that -1 spin transitions are skipped and counted.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        fname = _summary_with_negative_spin(directory)
+        res = _load_summary_sections(fname, "new")
+
+    expected = _parse_new_syntax_summary("summary_Ni56_gxpf1a_new_syntax.txt")
+    assert res.negative_spin_counts == [0, 0, 1, 0]
+    assert np.array_equal(res.transitions_BM1, expected["B(M1)"][1:])
+    assert np.array_equal(res.transitions_BE2, expected["B(E2)"])
+
+def test_loaders_without_pandas():
+    """
+    The loaders fall back to np.loadtxt when pandas is not installed.
+    Test that both give the same arrays for all the summary fixtures.
+    """
+    for fname, old_or_new in [
+        ("summary_Ni56_gxpf1a_new_syntax.txt", "new"),
+        ("summary_test_text_file.txt", "old"),
+        ("summary_Zn60_jun45_jem_syntax.txt", "jem"),
+    ]:
+        res = _load_summary_sections(fname, old_or_new)
+        with patch.object(loaders, "pd", None):
+            res_no_pandas = _load_summary_sections(fname, old_or_new)
+
+        assert res_no_pandas.negative_spin_counts == res.negative_spin_counts
+        for attribute in ["levels", "transitions_BE1", "transitions_BM1", "transitions_BE2"]:
+            msg = f"{fname}: Error in {attribute} without pandas."
+            assert np.array_equal(getattr(res_no_pandas, attribute), getattr(res, attribute)), msg
+
+    with patch.object(loaders, "pd", None):
+        test_loaders_new_syntax()
+        test_loaders_old_syntax()
+        test_loaders_jem_syntax()
+
+def _collect_logs_summary(directory: str) -> str:
+    """
+    Run collect_logs on a copy of the Ni56 log fixtures in 'directory'
+    and return the summary with the paths removed.
+    """
+    path = f"{directory}/logs"
+    shutil.copytree("logs_Ni56_gxpf1a", path)
+    with redirect_stdout(io.StringIO()):
+        fname = kshell_utilities.collect_logs(path=path, old_or_new="new")
+
+    with open(f"{path}/{fname}", "r") as infile:
+        return infile.read().replace(f"{path}/", "")
+
+def test_collect_logs():
+    """
+    Test that collect_logs generates the Ni56 summary fixture from the
+    Ni56 log fixtures, both with the numba compiled transit filter and
+    with the plain Python fallback which is used when numba is not
+    installed.
+    """
+    collect_logs_module = importlib.import_module("kshell_utilities.collect_logs")
+    with open("summary_Ni56_gxpf1a_new_syntax.txt", "r") as infile:
+        expected = infile.read()
+
+    with tempfile.TemporaryDirectory() as directory:
+        assert _collect_logs_summary(directory) == expected
+    
+    _filter_transit_data = collect_logs_module._filter_transit_data
+    with patch.object(collect_logs_module, "_filter_transit_data", getattr(_filter_transit_data, "py_func", _filter_transit_data)):
+        with tempfile.TemporaryDirectory() as directory:
+            assert _collect_logs_summary(directory) == expected
+
+def test_collect_logs_isotope_choice():
+    """
+    Test that only the log files of the chosen isotope are collected
+    when the log files of several isotopes are in the same directory.
+    The isotope names must match exactly, so Ni5 logs must not be
+    collected for Ni56 or the other way around.
+    """
+    with open("summary_Ni56_gxpf1a_new_syntax.txt", "r") as infile:
+        expected = infile.read()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = f"{directory}/logs"
+        shutil.copytree("logs_Ni56_gxpf1a", path)
+        for isotope in ["Ni5", "Ni58"]:
+            for spin_parity in ["j0p", "j2p"]:
+                shutil.copy(f"{path}/log_Ni56_gxpf1a_{spin_parity}.txt", f"{path}/log_{isotope}_gxpf1a_{spin_parity}.txt")
+
+        with patch("builtins.input", side_effect=["Ni", "Ni56"]) as mock_input:
+            with redirect_stdout(io.StringIO()):
+                fname = kshell_utilities.collect_logs(path=path, old_or_new="new")
+
+        assert mock_input.call_count == 2   # 'Ni' is not a valid choice.
+        assert "['Ni5', 'Ni56', 'Ni58']" in mock_input.call_args.args[0]
+        with open(f"{path}/{fname}", "r") as infile:
+            assert infile.read().replace(f"{path}/", "") == expected
+
+        with patch("builtins.input", return_value="Ni5"):
+            with redirect_stdout(io.StringIO()), pytest.warns(RuntimeWarning):
+                fname = kshell_utilities.collect_logs(path=path, old_or_new="new")
+
+        with open(f"{path}/{fname}", "r") as infile:
+            log_files = {os.path.basename(line.split()[-1]) for line in infile if line.strip().endswith(".txt")}
+        
+        assert log_files == {"log_Ni5_gxpf1a_j0p.txt", "log_Ni5_gxpf1a_j2p.txt"}
+
+def test_get_parameters():
+    """
+    Test that the KSHELL namelist parameters in the .sh file are read
+    with the correct types. Fortran booleans are converted to bool and
+    Fortran doubles are kept as strings.
+    """
+    content = "#!/bin/sh\n"
+    content += "cat > O19_usda_0.input <<EOF\n"
+    content += "&input\n"
+    content += "  beta_cm = 0.0\n"
+    content += "  eff_charge = 1.5, 0.5\n"
+    content += "  fn_int = \"usda.snt\"\n"
+    content += "  fn_ptn = 'O19_usda_p.ptn'\n"
+    content += "  hw_type = 1\n"
+    content += "  is_double_j = .false.\n"
+    content += "  is_calc_tbme = .TRUE.\n"
+    content += "  max_lanc_vec = 200\n"
+    content += "  tol = 1.d-6\n"
+    content += "  mode_lv_hdd = -1\n"
+    content += "&end\n"
+    content += "EOF\n"
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(f"{directory}/O19_usda.sh", "w") as outfile:
+            outfile.write(content)
+
+        res = kshell_utilities.get_parameters(path=directory, verbose=False)
+
+    expected = {
+        "beta_cm": 0.0,
+        "eff_charge": (1.5, 0.5),
+        "fn_int": "usda.snt",
+        "fn_ptn": "O19_usda_p.ptn",
+        "hw_type": 1,
+        "is_double_j": False,
+        "is_calc_tbme": True,
+        "max_lanc_vec": 200,
+        "tol": "1.d-6",
+        "mode_lv_hdd": -1,
+    }
+    assert res == expected
+    assert res["is_double_j"] is False
+    assert res["is_calc_tbme"] is True
+
+def test_overwrite_keeps_memory_mapped_arrays():
+    """
+    Arrays loaded from .npy are memory mapped. An 'overwrite' load of a
+    changed summary file saves to the same .npy files, which must not
+    change the arrays of the earlier load.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        fname = f"{directory}/summary_Ni56_gxpf1a.txt"
+        shutil.copy("summary_Ni56_gxpf1a_new_syntax.txt", fname)
+        with open(f"{directory}/run.sh", "w") as outfile:
+            outfile.write("echo Ni56\n")
+        
+        os.chdir(directory)  # The .npy files are saved relative to the working directory.
+        try:
+            kshell_utilities.loadtxt(path=fname)
+            res = kshell_utilities.loadtxt(path=fname)    # From .npy.
+            assert isinstance(res.transitions_BM1, np.memmap)
+            transitions_BM1_expected = np.array(res.transitions_BM1)
+
+            with open(fname, "r") as infile:
+                content = infile.read()
+            
+            with open(fname, "w") as outfile:
+                outfile.write(content.replace("38.45311855", "99.99999999"))  # Same size.
+
+            res_overwrite = kshell_utilities.loadtxt(path=fname, load_and_save_to_file="overwrite")
+            assert res_overwrite.transitions_BM1[0, 9] == 99.99999999
+            assert np.array_equal(res.transitions_BM1, transitions_BM1_expected)
+        finally:
+            os.chdir(cwd)
+
 if __name__ == "__main__":
     test_file_read_levels()
     test_int_vs_floor()
     test_file_read_transitions()
     test_file_read_levels_jem()
-    test_file_read_transitions_jem()
\ No newline at end of file
+    test_file_read_transitions_jem()
+    test_timing_data_m_scheme_logs()
+    test_sortkey()
+    test_unique_identifier_index_concurrent()
+    test_low_energy_enhancement_load_summaries()
+    test_load_selection_debug_counts()
+    test_load_selection()
+    test_loaders_new_syntax()
+    test_loaders_old_syntax()
+    test_loaders_jem_syntax()
+    test_loaders_negative_spin()
+    test_loaders_without_pandas()
+    test_collect_logs()
+    test_collect_logs_isotope_choice()
+    test_get_parameters()
+    test_overwrite_keeps_memory_mapped_arrays()
+    test_unique_identifier_relative_path()
+    test_unique_identifier_index_after_cache()